@@ -1,67 +1,181 @@
 """Main CLI application."""
 
-import structlog
+import functools
+import importlib
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
 
 from riparr import __version__
-from riparr.cli.commands import info, queue, rip, watch
-from riparr.config import get_settings
+from riparr.config import get_cli_settings, get_settings
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Subcommand modules, imported lazily on first use so that invocations
+# like `riparr --help` or `riparr --version` never pay for anyio, rich
+# progress, and the rest of each command's transitive import chain.
+SUBCOMMAND_MODULES = {
+    "rip": "riparr.cli.commands.rip",
+    "watch": "riparr.cli.commands.watch",
+    "info": "riparr.cli.commands.info",
+    "queue": "riparr.cli.commands.queue",
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that defers subcommand module imports until needed."""
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        """List commands, including not-yet-imported subcommands."""
+        commands = super().list_commands(ctx)
+        commands.extend(name for name in SUBCOMMAND_MODULES if name not in commands)
+        return commands
+
+    def get_command(self, ctx: typer.Context, name: str):
+        """Resolve a command, importing its module on first access."""
+        if name in SUBCOMMAND_MODULES:
+            module = importlib.import_module(SUBCOMMAND_MODULES[name])
+            command = typer.main.get_command(module.app)
+            command.name = name
+            return command
+        return super().get_command(ctx, name)
+
 
 app = typer.Typer(
     name="riparr",
+    cls=LazyTyperGroup,
     help="Modern DVD/Blu-ray ripper with automated disc detection and encoding.",
     no_args_is_help=True,
     rich_markup_mode="rich",
 )
 
-console = Console()
+_console: "Console | None" = None
 
 
-def configure_logging() -> None:
-    """Configure structured logging."""
-    import logging
+def _get_console() -> "Console":
+    """Construct the shared rich console on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
 
-    settings = get_settings()
+        _console = Console()
+    return _console
 
-    # Configure stdlib logging
-    logging.basicConfig(
-        format="%(message)s",
-        level=getattr(logging, settings.log_level.upper(), logging.INFO),
-    )
 
-    processors = [
-        structlog.stdlib.filter_by_level,
+def __getattr__(name: str) -> "Console":
+    """Expose `console` as a lazily constructed module attribute."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.cache
+def _processor_chains() -> tuple[tuple, tuple]:
+    """Build the structlog processor chains once per process.
+
+    Returns:
+        (json_chain, console_chain) tuples sharing a common prefix
+    """
+    import structlog
+
+    base = (
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.processors.TimeStamper(fmt="iso", utc=False),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.UnicodeDecoder(),
-    ]
+    )
+
+    try:
+        # orjson serializes structured records several times faster than
+        # stdlib json, which matters for long-running watch sessions.
+        import orjson
+
+        def _dumps(obj: object, **_: object) -> str:
+            return orjson.dumps(obj, default=str).decode()
+
+        json_renderer = structlog.processors.JSONRenderer(serializer=_dumps)
+    except ImportError:
+        json_renderer = structlog.processors.JSONRenderer()
+
+    return (
+        base + (json_renderer,),
+        base + (structlog.dev.ConsoleRenderer(colors=True),),
+    )
+
 
-    if settings.log_json:
-        processors.append(structlog.processors.JSONRenderer())
+@functools.cache
+def configure_logging(async_output: bool = False) -> None:
+    """Configure structured logging (idempotent).
+
+    Args:
+        async_output: Route log records through a background queue
+            listener so log calls never block on terminal writes. Used
+            by the long-running watch daemon.
+    """
+    import logging
+
+    import structlog
+
+    from riparr.log import install_real_logger
+
+    settings = get_cli_settings()
+    level = getattr(logging, settings.log_level.upper(), logging.INFO)
+
+    if async_output:
+        # Hot-path log calls only enqueue; a background thread does the
+        # actual (blocking) stream writes.
+        import atexit
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+
+        log_queue: queue.Queue = queue.Queue(-1)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        listener = QueueListener(log_queue, stream_handler)
+        listener.start()
+        atexit.register(listener.stop)
+
+        root = logging.getLogger()
+        root.handlers.clear()
+        root.addHandler(QueueHandler(log_queue))
+        root.setLevel(level)
     else:
-        processors.append(structlog.dev.ConsoleRenderer(colors=True))
+        # Configure stdlib logging
+        logging.basicConfig(
+            format="%(message)s",
+            level=level,
+        )
+
+    json_chain, console_chain = _processor_chains()
+    processors = list(json_chain if settings.log_json else console_chain)
 
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Level filtering happens in the bound logger itself, so a
+        # disabled log.debug() returns before any event dict or
+        # processor work; filter_by_level in the chain would be too late.
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
+    install_real_logger()
+
 
 def version_callback(value: bool) -> None:
     """Show version and exit."""
     if value:
-        console.print(f"[bold blue]riparr[/] version [green]{__version__}[/]")
+        typer.echo(f"riparr version {__version__}")
         raise typer.Exit()
 
 
 @app.callback()
 def main_callback(
+    ctx: typer.Context,
     version: bool = typer.Option(
         None,
         "--version",
@@ -72,14 +186,11 @@ def main_callback(
     ),
 ) -> None:
     """Riparr - Modern DVD/Blu-ray ripper."""
-    configure_logging()
-
-
-# Register subcommands
-app.add_typer(rip.app, name="rip")
-app.add_typer(watch.app, name="watch")
-app.add_typer(info.app, name="info")
-app.add_typer(queue.app, name="queue")
+    # Only configure logging when a subcommand will actually run; --help
+    # and bare invocations never emit a log line.
+    if ctx.invoked_subcommand is None:
+        return
+    configure_logging(async_output=ctx.invoked_subcommand == "watch")
 
 
 @app.command()
@@ -88,26 +199,73 @@ def config() -> None:
     from rich.panel import Panel
     from rich.table import Table
 
+    console = _get_console()
     settings = get_settings()
 
     table = Table(title="Riparr Configuration", show_header=True)
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
 
-    for field_name, _field_info in settings.model_fields.items():
-        value = getattr(settings, field_name)
-        # Mask sensitive values
-        if "key" in field_name.lower() and value:
-            display_value = "***" + str(value)[-4:] if len(str(value)) > 4 else "****"
-        else:
-            display_value = str(value)
-        table.add_row(field_name, display_value)
+    def display_value(name: str, value: object) -> str:
+        """Stringify a field value, masking sensitive keys."""
+        # Field names are already lowercase, so no per-field .lower()
+        text = str(value)
+        if "key" in name and value:
+            return "***" + text[-4:] if len(text) > 4 else "****"
+        return text
+
+    rows = [
+        (name, display_value(name, getattr(settings, name)))
+        for name in settings.model_fields
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(Panel(table))
 
 
+# Hand-written top-level help, printed without building the Typer parser
+# tree (which would import every subcommand module just to render it).
+_FAST_HELP = """\
+Usage: riparr [OPTIONS] COMMAND [ARGS]...
+
+  Modern DVD/Blu-ray ripper with automated disc detection and encoding.
+
+Options:
+  -v, --version  Show version and exit.
+  --help         Show this message and exit.
+
+Commands:
+  rip     Rip disc from optical drive.
+  watch   Watch for disc insertions and auto-rip.
+  info    Display disc information.
+  queue   Manage encoding queue.
+  config  Display current configuration.
+"""
+
+
 def main() -> None:
     """Entry point for the CLI."""
+    import os
+    import sys
+
+    if len(sys.argv) == 2 and sys.argv[1] in ("--help", "-h"):
+        print(_FAST_HELP, end="")
+        return
+
+    # Opt-in persistent daemon: dispatch over the CLI socket when one is
+    # running, spawning it on the first call so later invocations skip
+    # interpreter and import startup entirely. Only short, non-interactive
+    # commands qualify; watch/rip always run in the foreground below.
+    if os.environ.get("RIPARR_DAEMON") == "1":
+        from riparr.cli import daemon
+
+        if daemon.daemon_eligible(sys.argv[1:]):
+            exit_code = daemon.try_client(sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+            daemon.spawn_daemon()
+
     app()
 
 
@@ -2,18 +2,17 @@
 
 from typing import Annotated
 
-import anyio
-import structlog
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from riparr.config import get_settings
+from riparr.config import get_cli_settings, get_settings
+from riparr.log import get_logger
 
 app = typer.Typer(help="Display disc information.")
 console = Console()
-log = structlog.get_logger()
+log = get_logger()
 
 
 @app.callback(invoke_without_command=True)
@@ -31,11 +30,13 @@ def info(
 
     Shows disc metadata, titles, audio tracks, and subtitles.
     """
-    settings = get_settings()
+    settings = get_cli_settings()
     device = device or settings.default_device
 
     console.print(f"[bold blue]Scanning disc in[/] [cyan]{device}[/]...\n")
 
+    import anyio
+
     anyio.run(_show_info, device, json_output)
 
 
@@ -75,7 +76,7 @@ async def _show_info(device: str, json_output: bool) -> None:
     if json_output:
         import json
 
-        output = disc.model_dump(mode="json")
+        output = disc.to_dict()
         console.print(json.dumps(output, indent=2))
         return
 
@@ -7,11 +7,18 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from riparr.config import get_settings
+from riparr.config import get_cli_settings
 
 app = typer.Typer(help="Manage encoding queue.")
 console = Console()
 
+STATUS_STYLES = {
+    "ready": "green",
+    "transcoding": "yellow",
+    "failed": "red",
+    "complete": "blue",
+}
+
 
 @app.command("list")
 def list_queue(
@@ -23,7 +30,7 @@ def list_queue(
     """List items in the encoding queue."""
     from riparr.queue.markers import MarkerManager
 
-    settings = get_settings()
+    settings = get_cli_settings()
     markers = MarkerManager(settings.raw_dir)
 
     jobs = markers.list_jobs(status_filter=status)
@@ -39,12 +46,7 @@ def list_queue(
     table.add_column("Created", width=20)
 
     for job in jobs:
-        status_style = {
-            "ready": "green",
-            "transcoding": "yellow",
-            "failed": "red",
-            "complete": "blue",
-        }.get(job.status, "dim")
+        status_style = STATUS_STYLES.get(job.status, "dim")
 
         table.add_row(
             job.name,
@@ -66,7 +68,7 @@ def retry_failed(
     """Retry failed encoding jobs."""
     from riparr.queue.markers import MarkerManager
 
-    settings = get_settings()
+    settings = get_cli_settings()
     markers = MarkerManager(settings.raw_dir)
 
     if name == "all":
@@ -95,7 +97,7 @@ def clear_queue(
     """Clear items from the queue."""
     from riparr.queue.markers import MarkerManager
 
-    settings = get_settings()
+    settings = get_cli_settings()
     markers = MarkerManager(settings.raw_dir)
 
     jobs = markers.list_jobs(status_filter=status)
@@ -123,7 +125,7 @@ def add_to_queue(
     """Add existing MKV files to encoding queue."""
     from riparr.queue.markers import MarkerManager
 
-    settings = get_settings()
+    settings = get_cli_settings()
     markers = MarkerManager(settings.raw_dir)
 
     if path.is_file():
@@ -133,10 +135,14 @@ def add_to_queue(
         markers.create_marker(path, "ready")
         console.print(f"[green]Added to queue:[/] {path.name}")
     elif path.is_dir():
+        import os
+
         count = 0
-        for mkv in path.glob("*.mkv"):
-            markers.create_marker(mkv, "ready")
-            count += 1
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".mkv"):
+                    markers.create_marker(path / entry.name, "ready")
+                    count += 1
         console.print(f"[green]Added {count} file(s) to queue[/]")
     else:
         console.print(f"[red]Path not found:[/] {path}")
@@ -3,17 +3,15 @@
 from pathlib import Path
 from typing import Annotated
 
-import anyio
-import structlog
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from riparr.config import get_settings
+from riparr.config import get_cli_settings, get_settings
+from riparr.log import get_logger
 
 app = typer.Typer(help="Rip disc from optical drive.")
 console = Console()
-log = structlog.get_logger()
+log = get_logger()
 
 
 @app.callback(invoke_without_command=True)
@@ -47,7 +45,7 @@ def rip(
 
     If no device is specified, uses the default device from configuration.
     """
-    settings = get_settings()
+    settings = get_cli_settings()
     device = device or settings.default_device
     output_dir = output or settings.raw_dir
 
@@ -56,6 +54,14 @@ def rip(
     if dry_run:
         console.print("[yellow]Dry run mode - no changes will be made[/]")
 
+    import anyio
+
+    if not dry_run:
+        from riparr.metadata._prewarm import prewarm_metadata_libs
+
+        # Load pydvdid_m/pymediainfo off the event loop during the scan
+        prewarm_metadata_libs()
+
     anyio.run(
         _run_rip,
         device,
@@ -76,11 +82,12 @@ async def _run_rip(
     dry_run: bool,
 ) -> None:
     """Execute the rip operation."""
-    from riparr.core.job import Job, JobStatus
-    from riparr.encoder.handbrake import HandBrake
+    import os
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     from riparr.metadata.arm_api import lookup_disc
     from riparr.metadata.dvdid import compute_dvd_id
-    from riparr.output.naming import OutputNamer
     from riparr.ripper.makemkv import MakeMKV
     from riparr.ripper.selector import TitleSelector
 
@@ -133,6 +140,8 @@ async def _run_rip(
             return
 
         # Step 4: Rip titles
+        from riparr.core.job import Job, JobStatus
+
         job = Job(disc=disc, selected_titles=selected, output_dir=output_dir)
 
         for idx, t in enumerate(selected, 1):
@@ -149,28 +158,55 @@ async def _run_rip(
 
         # Step 5: Encode (if enabled)
         if not no_encode and settings.encode_enabled:
+            import anyio
+
+            from riparr.encoder.handbrake import EncodeOptions, HandBrake
+            from riparr.output.naming import OutputNamer
+
             progress.update(task, description="Starting encoding...")
             handbrake = HandBrake(settings.handbrake_path)
             namer = OutputNamer(settings)
 
-            for mkv_file in output_dir.glob("*.mkv"):
-                output_path = namer.get_output_path(disc, mkv_file)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                progress.update(task, description=f"Encoding {mkv_file.name}...")
-                await handbrake.encode(
-                    mkv_file,
-                    output_path,
-                    preset=settings.handbrake_preset,
-                    video_codec=settings.video_codec,
-                    quality=settings.video_quality,
-                    encoder_preset=settings.encoder_preset,
-                    deinterlace=settings.deinterlace,
-                    subtitle_scan=settings.subtitle_scan,
-                    progress_callback=lambda info: progress.update(
-                        task, description=f"Encoding: {info.percent:.1f}%"
-                    ),
-                )
+            # Bind encode options once; Pydantic attribute access isn't free
+            # and none of these change between files.
+            encode_options = EncodeOptions.from_settings(settings)
+
+            # Single scandir pass beats glob's pattern matching per entry
+            with os.scandir(output_dir) as entries:
+                mkv_files = [
+                    output_dir / entry.name
+                    for entry in entries
+                    if entry.is_file() and entry.name.endswith(".mkv")
+                ]
+
+            limiter = anyio.CapacityLimiter(settings.max_concurrent_encodes)
+
+            async def encode_one(mkv_file: Path) -> None:
+                """Encode a single file under the concurrency limiter."""
+                async with limiter:
+                    output_path = namer.get_output_path(disc, mkv_file)
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+                    encode_task = progress.add_task(
+                        f"Encoding {mkv_file.name}...", total=None
+                    )
+                    try:
+                        await handbrake.encode(
+                            mkv_file,
+                            output_path,
+                            options=encode_options,
+                            progress_callback=lambda info: progress.update(
+                                encode_task,
+                                description=f"Encoding {mkv_file.name}: {info.percent:.1f}%",
+                            ),
+                        )
+                    finally:
+                        progress.remove_task(encode_task)
+
+            # Encode files concurrently up to max_concurrent_encodes
+            async with anyio.create_task_group() as tg:
+                for mkv_file in mkv_files:
+                    tg.start_soon(encode_one, mkv_file)
 
             job.status = JobStatus.COMPLETE
             console.print(f"[green]Encoding complete![/] Files saved to {settings.output_dir}")
@@ -186,6 +222,8 @@ async def _eject_disc(device: str) -> None:
     """Eject the disc from the drive."""
     import subprocess
 
+    import anyio
+
     proc = await anyio.to_thread.run_sync(
         lambda: subprocess.run(["eject", device], capture_output=True)
     )
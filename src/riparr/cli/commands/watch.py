@@ -2,16 +2,15 @@
 
 from typing import Annotated
 
-import anyio
-import structlog
 import typer
 from rich.console import Console
 
-from riparr.config import get_settings
+from riparr.config import get_cli_settings, get_settings
+from riparr.log import get_logger
 
 app = typer.Typer(help="Watch for disc insertions and auto-rip.")
 console = Console()
-log = structlog.get_logger()
+log = get_logger()
 
 
 @app.callback(invoke_without_command=True)
@@ -37,7 +36,7 @@ def watch(
     Use --gui for a live dashboard showing rip progress, encoding status,
     and the encode queue.
     """
-    settings = get_settings()
+    settings = get_cli_settings()
 
     device_list = devices or [settings.default_device]
 
@@ -47,6 +46,14 @@ def watch(
         console.print(f"Detection method: {settings.detection_method}")
         console.print("\n[dim]Press Ctrl+C to stop[/]\n")
 
+    import anyio
+
+    from riparr.metadata._prewarm import prewarm_metadata_libs
+
+    # Load pydvdid_m/pymediainfo off the event loop while we wait for
+    # the first disc.
+    prewarm_metadata_libs()
+
     try:
         anyio.run(_run_watch, device_list, once, gui)
     except KeyboardInterrupt:
@@ -56,6 +63,8 @@ def watch(
 
 async def _run_watch(devices: list[str], once: bool, gui: bool) -> None:
     """Run the watch daemon."""
+    import anyio
+
     from riparr.detection.watcher import DiscWatcher
     from riparr.queue.manager import QueueManager
     from riparr.tui.status import get_tracker
@@ -115,6 +124,8 @@ async def _run_with_dashboard(
     on_remove,
 ) -> None:
     """Run watch mode with live dashboard."""
+    import anyio
+
     from riparr.tui.dashboard import Dashboard
 
     dashboard = Dashboard(tracker)
@@ -123,12 +134,25 @@ async def _run_with_dashboard(
     tracker.add_event(f"Watching devices: {', '.join(devices)}")
 
     async def update_queue_display() -> None:
-        """Periodically update queue display."""
+        """Update the queue display when the marker directory changes."""
         from riparr.tui.status import QueuedItem
 
+        markers = queue_manager.markers
+
+        last_signature: tuple[int, ...] | None = None
+        last_items: list[QueuedItem] = []
+
         while True:
-            await anyio.sleep(2)
-            jobs = queue_manager.markers.list_jobs()
+            await anyio.sleep(0.25)
+
+            # The same signature keys the list_jobs cache, so a changed
+            # signature here guarantees the rebuild below sees fresh data.
+            signature = markers.marker_signature()
+            if signature == last_signature:
+                continue
+            last_signature = signature
+
+            jobs = markers.list_jobs()
             # Filter out completed items - they're not really "queued"
             items = [
                 QueuedItem(
@@ -140,7 +164,9 @@ async def _run_with_dashboard(
                 for j in jobs
                 if j.status != "complete"
             ]
-            tracker.update_queue(items)
+            if items != last_items:
+                tracker.update_queue(items)
+                last_items = items
 
     with dashboard.start():
         async with anyio.create_task_group() as tg:
@@ -0,0 +1,200 @@
+"""Persistent CLI daemon for fast repeated invocations.
+
+Repeated short commands (``riparr queue list`` in a shell loop, etc.)
+pay the full interpreter + typer + rich startup on every call. When
+``RIPARR_DAEMON=1`` is set, the first invocation spawns a detached
+background process that keeps the CLI imported and listens on a Unix
+socket; subsequent invocations of the allowlisted short commands send
+their argv over the socket and print the captured output. Long-running
+or interactive commands (``watch``, ``rip``) never touch the socket.
+
+The protocol is a single JSON object per direction:
+    request:  {"argv": [...], "cwd": "...", "env": {"RIPARR_*": "..."}}
+    response: {"output": "...", "exit_code": 0}
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+
+_SOCKET_TIMEOUT = 30.0
+
+# Commands safe to run inside the daemon: short, non-interactive, and
+# done in well under the socket timeout. Long-running commands (watch,
+# rip) would wedge the single-threaded serve() loop with their output
+# swallowed while the client times out, so they always run in the
+# foreground via the normal app() path.
+_DAEMON_COMMANDS = frozenset({"queue", "info"})
+
+
+def daemon_eligible(argv: list[str]) -> bool:
+    """Whether an invocation is safe to dispatch over the daemon socket.
+
+    Args:
+        argv: CLI arguments (without the program name)
+
+    Returns:
+        True if the command is on the short, non-interactive allowlist
+    """
+    if not argv:
+        return False
+    return argv[0] in _DAEMON_COMMANDS or argv[0] in ("-v", "--version")
+
+
+def socket_path() -> Path:
+    """Path of the daemon's Unix socket."""
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cache_dir / "riparr" / "cli.sock"
+
+
+def _run_command(argv: list[str], cwd: str, env: dict[str, str]) -> tuple[str, int]:
+    """Run one CLI invocation in-process, capturing output and exit code."""
+    from riparr.cli.app import app
+    from riparr.config.settings import get_cli_settings, get_settings
+
+    # Enforced server-side as well, so a stale or foreign client can't
+    # wedge the accept loop with a long-running command.
+    if not daemon_eligible(argv):
+        return (f"Command not served by the daemon: {' '.join(argv) or '(none)'}\n", 2)
+
+    buffer = io.StringIO()
+    exit_code = 0
+    old_cwd = os.getcwd()
+    old_env = {k: v for k, v in os.environ.items() if k.startswith("RIPARR_")}
+
+    try:
+        os.chdir(cwd)
+        for key in old_env:
+            if key not in env:
+                del os.environ[key]
+        os.environ.update(env)
+        # Settings are cached per process; re-derive them under the
+        # caller's environment and cwd (.env lookup) so a config change
+        # between invocations isn't served from the daemon's first
+        # snapshot.
+        get_cli_settings.cache_clear()
+        get_settings.cache_clear()
+        with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+            try:
+                app(args=argv, standalone_mode=False)
+            except SystemExit as e:
+                # e.code can be an int, a message string, or None; a
+                # string must not raise out of this handler and kill
+                # the accept loop.
+                if isinstance(e.code, int):
+                    exit_code = e.code
+                elif e.code:
+                    buffer.write(f"{e.code}\n")
+                    exit_code = 1
+            except Exception as e:
+                buffer.write(f"Error: {e}\n")
+                exit_code = 1
+    finally:
+        os.chdir(old_cwd)
+        for key in list(os.environ):
+            if key.startswith("RIPARR_") and key not in old_env:
+                del os.environ[key]
+        os.environ.update(old_env)
+
+    return buffer.getvalue(), exit_code
+
+
+def serve() -> None:
+    """Listen on the CLI socket and dispatch incoming invocations."""
+    path = socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(OSError):
+        path.unlink()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+
+    # Warm the import caches so the first dispatched command is fast too
+    import riparr.cli.app  # noqa: F401
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(_SOCKET_TIMEOUT)
+                try:
+                    request = json.loads(_recv_all(conn))
+                    output, exit_code = _run_command(
+                        request.get("argv", []),
+                        request.get("cwd", os.getcwd()),
+                        request.get("env", {}),
+                    )
+                    conn.sendall(
+                        json.dumps({"output": output, "exit_code": exit_code}).encode()
+                    )
+                except (json.JSONDecodeError, OSError):
+                    continue
+    finally:
+        server.close()
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    """Read from a connection until the peer shuts down its write side."""
+    chunks = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def try_client(argv: list[str]) -> int | None:
+    """Dispatch argv to a running daemon if one is listening.
+
+    Returns:
+        The daemon's exit code for the invocation (output already
+        printed), or None if no daemon is reachable.
+    """
+    path = socket_path()
+    if not path.exists():
+        return None
+
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        # The daemon re-derives settings per dispatch from the caller's
+        # RIPARR_* environment; forward it so config changes take
+        # effect without a daemon restart.
+        "env": {k: v for k, v in os.environ.items() if k.startswith("RIPARR_")},
+    }
+
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.settimeout(_SOCKET_TIMEOUT)
+        client.connect(str(path))
+        client.sendall(json.dumps(request).encode())
+        client.shutdown(socket.SHUT_WR)
+        response = json.loads(_recv_all(client))
+        client.close()
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    sys.stdout.write(response.get("output", ""))
+    code = response.get("exit_code", 0)
+    return code if isinstance(code, int) else 1
+
+
+def spawn_daemon() -> None:
+    """Start a detached daemon process for subsequent invocations."""
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, "-m", "riparr.cli.daemon"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+if __name__ == "__main__":
+    serve()
@@ -1,5 +1,11 @@
 """Configuration management."""
 
-from riparr.config.settings import Settings, get_settings
+from riparr.config.settings import (
+    CliSettings,
+    FastSettings,
+    Settings,
+    get_cli_settings,
+    get_settings,
+)
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["CliSettings", "FastSettings", "Settings", "get_cli_settings", "get_settings"]
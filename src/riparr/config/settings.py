@@ -1,6 +1,8 @@
 """Pydantic settings for riparr configuration."""
 
-from functools import lru_cache
+import os
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -8,14 +10,33 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
-class Settings(BaseSettings):
-    """Application settings with environment variable support."""
+def _expand_path(v: str | Path) -> Path:
+    """Expand a user path, building at most one Path object.
+
+    Path.expanduser() constructs an intermediate Path before producing
+    the expanded one; expanding the raw string first halves the Path
+    allocations, and default Path constants pass straight through.
+    """
+    if isinstance(v, Path):
+        return v
+    return Path(os.path.expanduser(v))
+
+
+class CliSettings(BaseSettings):
+    """Minimal settings needed by CLI callbacks.
+
+    Kept deliberately small so commands that only need a device path or
+    directory don't pay for validating the full runtime configuration.
+    """
 
     model_config = SettingsConfigDict(
         env_prefix="RIPARR_",
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        # Defaults are trusted constants; only env-supplied values need
+        # to pass through validation.
+        validate_default=False,
     )
 
     # Directories
@@ -23,6 +44,40 @@ class Settings(BaseSettings):
         default=Path("/data/raw"),
         description="Directory for raw MKV output from MakeMKV",
     )
+
+    # Device settings
+    default_device: str = Field(
+        default="/dev/sr0",
+        description="Default optical drive device",
+    )
+
+    # Detection
+    detection_method: Literal["auto", "udev", "polling"] = Field(
+        default="auto",
+        description="Disc detection method (auto, udev, polling)",
+    )
+
+    # Logging
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
+        default="INFO",
+        description="Logging level",
+    )
+    log_json: bool = Field(
+        default=False,
+        description="Output logs in JSON format",
+    )
+
+    @field_validator("raw_dir", mode="before")
+    @classmethod
+    def expand_cli_path(cls, v: str | Path) -> Path:
+        """Expand user home directory in paths."""
+        return _expand_path(v)
+
+
+class Settings(CliSettings):
+    """Full application settings with environment variable support."""
+
+    # Directories
     output_dir: Path = Field(
         default=Path("/data/media"),
         description="Final output directory for encoded files",
@@ -33,10 +88,6 @@ class Settings(BaseSettings):
     )
 
     # Device settings
-    default_device: str = Field(
-        default="/dev/sr0",
-        description="Default optical drive device",
-    )
     eject_after_rip: bool = Field(
         default=True,
         description="Eject disc after successful rip",
@@ -117,26 +168,12 @@ class Settings(BaseSettings):
     )
 
     # Detection
-    detection_method: Literal["auto", "udev", "polling"] = Field(
-        default="auto",
-        description="Disc detection method (auto, udev, polling)",
-    )
     poll_interval: float = Field(
         default=5.0,
         ge=1.0,
         description="Polling interval in seconds when using polling detection",
     )
 
-    # Logging
-    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
-        default="INFO",
-        description="Logging level",
-    )
-    log_json: bool = Field(
-        default=False,
-        description="Output logs in JSON format",
-    )
-
     # Queue settings
     max_concurrent_rips: int = Field(
         default=1,
@@ -149,11 +186,73 @@ class Settings(BaseSettings):
         description="Maximum concurrent encode operations",
     )
 
-    @field_validator("raw_dir", "output_dir", "temp_dir", mode="before")
+    @field_validator("output_dir", "temp_dir", mode="before")
     @classmethod
     def expand_path(cls, v: str | Path) -> Path:
         """Expand user home directory in paths."""
-        return Path(v).expanduser()
+        return _expand_path(v)
+
+
+@dataclass(frozen=True, slots=True)
+class FastSettings:
+    """Frozen snapshot of the CLI-core settings.
+
+    Built from a single environment sweep without Pydantic validation,
+    so CLI callbacks pay near-zero settings cost. Field names and
+    defaults mirror :class:`CliSettings`.
+    """
+
+    raw_dir: Path = Path("/data/raw")
+    default_device: str = "/dev/sr0"
+    detection_method: str = "auto"
+    log_level: str = "INFO"
+    log_json: bool = False
+
+
+def _read_dotenv(path: str = ".env") -> dict[str, str]:
+    """Minimal .env parser (KEY=VALUE lines, # comments, quoted values)."""
+    values: dict[str, str] = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                values[key.strip()] = value.strip().strip("'\"")
+    except OSError:
+        pass
+    return values
+
+
+@cache
+def get_cli_settings() -> FastSettings:
+    """Get cached CLI-core settings snapshot.
+
+    Environment variables take precedence over `.env`, matching the
+    pydantic-settings resolution order used by :func:`get_settings`.
+    """
+    values = _read_dotenv()
+    values.update(os.environ)
+
+    def get(name: str, default: str) -> str:
+        return values.get(f"RIPARR_{name}", default)
+
+    log_level = get("LOG_LEVEL", "INFO").upper()
+    if log_level not in ("DEBUG", "INFO", "WARNING", "ERROR"):
+        log_level = "INFO"
+
+    detection_method = get("DETECTION_METHOD", "auto").lower()
+    if detection_method not in ("auto", "udev", "polling"):
+        detection_method = "auto"
+
+    return FastSettings(
+        raw_dir=_expand_path(get("RAW_DIR", "/data/raw")),
+        default_device=get("DEFAULT_DEVICE", "/dev/sr0"),
+        detection_method=detection_method,
+        log_level=log_level,
+        log_json=get("LOG_JSON", "false").lower() in ("1", "true", "yes", "on"),
+    )
 
 
 @lru_cache
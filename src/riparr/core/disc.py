@@ -1,10 +1,15 @@
-"""Disc and title models."""
+"""Disc and title models.
 
-from datetime import timedelta
-from enum import StrEnum
-from typing import Self
+These are internal hot-path models constructed in bulk during disc
+scanning; they are plain slotted dataclasses rather than Pydantic models
+since their inputs are produced by our own parsers, not untrusted JSON.
+Serialization for the JSON output boundary goes through `Disc.to_dict`.
+"""
 
-from pydantic import BaseModel, Field, computed_field
+import re
+from dataclasses import asdict, dataclass, field
+from enum import StrEnum
+from typing import Any, Self
 
 
 class DiscType(StrEnum):
@@ -24,7 +29,21 @@ class MediaType(StrEnum):
     UNKNOWN = "unknown"
 
 
-class AudioTrack(BaseModel):
+_CHANNEL_LAYOUTS = {
+    1: "Mono",
+    2: "Stereo",
+    6: "5.1",
+    8: "7.1",
+}
+
+# One compiled scan instead of a substring search per indicator ("HDR"
+# also made the separate "HDR10" check redundant); DV needs word
+# boundaries so codec names merely containing the letters don't match.
+_HDR_RE = re.compile(r"HDR10?|Dolby Vision|\bDV\b|HLG")
+
+
+@dataclass(slots=True)
+class AudioTrack:
     """Audio track information."""
 
     index: int
@@ -34,20 +53,14 @@ class AudioTrack(BaseModel):
     name: str = ""
     default: bool = False
 
-    @computed_field
     @property
     def channel_layout(self) -> str:
         """Human-readable channel layout."""
-        layouts = {
-            1: "Mono",
-            2: "Stereo",
-            6: "5.1",
-            8: "7.1",
-        }
-        return layouts.get(self.channels, f"{self.channels}ch")
+        return _CHANNEL_LAYOUTS.get(self.channels, f"{self.channels}ch")
 
 
-class SubtitleTrack(BaseModel):
+@dataclass(slots=True)
+class SubtitleTrack:
     """Subtitle track information."""
 
     index: int
@@ -58,36 +71,59 @@ class SubtitleTrack(BaseModel):
     default: bool = False
 
 
-class Title(BaseModel):
+@dataclass(slots=True)
+class Title:
     """A title/track on the disc."""
 
     index: int
-    duration: int = Field(default=0, description="Duration in seconds")
+    duration: int = 0  # seconds
     chapters: int = 0
     size_bytes: int = 0
     video_codec: str = ""
     resolution: str = ""
     frame_rate: float = 0.0
-    audio_tracks: list[AudioTrack] = Field(default_factory=list)
-    subtitle_tracks: list[SubtitleTrack] = Field(default_factory=list)
+    audio_tracks: list[AudioTrack] = field(default_factory=list)
+    subtitle_tracks: list[SubtitleTrack] = field(default_factory=list)
     segment_count: int = 1
     segment_map: str = ""
     source_file: str = ""
     output_file: str = ""
 
-    @computed_field
+    # Derived-value caches, keyed by the source field so post-construction
+    # mutation (the MakeMKV parser fills titles attribute by attribute)
+    # invalidates them naturally. Slots preclude functools.cached_property.
+    _duration_str: tuple[int, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _size_str: tuple[int, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _is_hdr: tuple[str, bool] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def duration_str(self) -> str:
         """Duration as HH:MM:SS string."""
-        td = timedelta(seconds=self.duration)
-        hours, remainder = divmod(int(td.total_seconds()), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        cached = self._duration_str
+        if cached is None or cached[0] != self.duration:
+            hours, remainder = divmod(self.duration, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            self._duration_str = cached = (
+                self.duration,
+                f"{hours:02d}:{minutes:02d}:{seconds:02d}",
+            )
+        return cached[1]
 
-    @computed_field
     @property
     def size_str(self) -> str:
         """Human-readable size string."""
+        cached = self._size_str
+        if cached is None or cached[0] != self.size_bytes:
+            self._size_str = cached = (self.size_bytes, self._format_size())
+        return cached[1]
+
+    def _format_size(self) -> str:
         if self.size_bytes == 0:
             return "N/A"
         size = float(self.size_bytes)
@@ -97,15 +133,20 @@ class Title(BaseModel):
             size /= 1024
         return f"{size:.1f} TB"
 
-    @computed_field
     @property
     def is_hdr(self) -> bool:
         """Check if title has HDR content."""
-        hdr_indicators = ["HDR", "HDR10", "Dolby Vision", "DV", "HLG"]
-        return any(ind in self.video_codec for ind in hdr_indicators)
+        cached = self._is_hdr
+        if cached is None or cached[0] != self.video_codec:
+            self._is_hdr = cached = (
+                self.video_codec,
+                _HDR_RE.search(self.video_codec) is not None,
+            )
+        return cached[1]
 
 
-class DiscMetadata(BaseModel):
+@dataclass(slots=True)
+class DiscMetadata:
     """Metadata from external sources."""
 
     title: str
@@ -119,7 +160,8 @@ class DiscMetadata(BaseModel):
     episode_count: int | None = None
 
 
-class Disc(BaseModel):
+@dataclass(slots=True)
+class Disc:
     """Represents an optical disc."""
 
     name: str = ""
@@ -127,22 +169,64 @@ class Disc(BaseModel):
     disc_type: DiscType = DiscType.UNKNOWN
     dvd_id: str | None = None
     label: str | None = None
-    titles: list[Title] = Field(default_factory=list)
+    titles: list[Title] = field(default_factory=list)
     metadata: DiscMetadata | None = None
 
-    @computed_field
+    # Totals cache keyed by title count; titles are append-only and fully
+    # populated before being added, so the count is a sufficient key.
+    _totals: tuple[int, int, int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Sanitized output folder name, computed by the queue manager and
+    # keyed by the title it was derived from (metadata arrives after
+    # construction). Slots preclude functools.cached_property.
+    _folder_name: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _compute_totals(self) -> tuple[int, int, int]:
+        cached = self._totals
+        if cached is None or cached[0] != len(self.titles):
+            self._totals = cached = (
+                len(self.titles),
+                sum(t.duration for t in self.titles),
+                sum(t.size_bytes for t in self.titles),
+            )
+        return cached
+
     @property
     def total_duration(self) -> int:
         """Total duration of all titles in seconds."""
-        return sum(t.duration for t in self.titles)
+        return self._compute_totals()[1]
 
-    @computed_field
     @property
     def total_size(self) -> int:
         """Total size of all titles in bytes."""
-        return sum(t.size_bytes for t in self.titles)
+        return self._compute_totals()[2]
 
     @classmethod
     def from_label(cls, label: str, device: str = "") -> Self:
         """Create disc from label string."""
         return cls(name=label, label=label, device=device)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-ready dicts, including derived fields."""
+        data = asdict(
+            self,
+            dict_factory=lambda items: {
+                k: v for k, v in items if not k.startswith("_")
+            },
+        )
+        data["total_duration"] = self.total_duration
+        data["total_size"] = self.total_size
+
+        for title, title_data in zip(self.titles, data["titles"], strict=True):
+            title_data["duration_str"] = title.duration_str
+            title_data["size_str"] = title.size_str
+            title_data["is_hdr"] = title.is_hdr
+            for track, track_data in zip(
+                title.audio_tracks, title_data["audio_tracks"], strict=True
+            ):
+                track_data["channel_layout"] = track.channel_layout
+
+        return data
@@ -1,11 +1,12 @@
 """Job state machine for rip/encode operations."""
 
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import StrEnum
 from pathlib import Path
 
-from pydantic import BaseModel, Field
-
 from riparr.core.disc import Disc, Title
 
 
@@ -22,32 +23,56 @@ class JobStatus(StrEnum):
     CANCELLED = "cancelled"
 
 
-class JobError(BaseModel):
+_ACTIVE_STATUSES = frozenset({JobStatus.SCANNING, JobStatus.RIPPING, JobStatus.ENCODING})
+_TERMINAL_STATUSES = frozenset({JobStatus.COMPLETE, JobStatus.FAILED, JobStatus.CANCELLED})
+
+# Process-local ID source; collision-free (unlike second-resolution
+# timestamps) and avoids a clock read per job. Creation time already
+# lives in created_at.
+_id_counter = itertools.count()
+
+
+@dataclass(slots=True)
+class JobError:
     """Error information for failed jobs."""
 
     message: str
     stage: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=datetime.now)
     details: str | None = None
 
 
-class Job(BaseModel):
+@dataclass(slots=True)
+class Job:
     """Represents a rip/encode job."""
 
-    id: str = Field(default_factory=lambda: datetime.now().strftime("%Y%m%d_%H%M%S"))
     disc: Disc
-    selected_titles: list[Title] = Field(default_factory=list)
     output_dir: Path
+    id: str = field(default_factory=lambda: f"{next(_id_counter):08x}")
+    selected_titles: list[Title] = field(default_factory=list)
     status: JobStatus = JobStatus.PENDING
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=datetime.now)
     started_at: datetime | None = None
     completed_at: datetime | None = None
     current_title: int | None = None
     progress: float = 0.0
-    errors: list[JobError] = Field(default_factory=list)
-    output_files: list[Path] = Field(default_factory=list)
-
-    model_config = {"arbitrary_types_allowed": True}
+    errors: list[JobError] = field(default_factory=list)
+    output_files: list[Path] = field(default_factory=list)
+
+    # Set by JobQueue so status transitions keep its buckets current.
+    _on_status_change: "Callable[[Job, JobStatus, JobStatus], None] | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name == "status":
+            old = getattr(self, "status", None)
+            object.__setattr__(self, name, value)
+            callback = getattr(self, "_on_status_change", None)
+            if callback is not None and old is not None and old is not value:
+                callback(self, old, value)  # type: ignore[arg-type]
+        else:
+            object.__setattr__(self, name, value)
 
     def start(self) -> None:
         """Mark job as started."""
@@ -74,7 +99,7 @@ class Job(BaseModel):
     @property
     def is_terminal(self) -> bool:
         """Check if job is in a terminal state."""
-        return self.status in (JobStatus.COMPLETE, JobStatus.FAILED, JobStatus.CANCELLED)
+        return self.status in _TERMINAL_STATUSES
 
     @property
     def can_retry(self) -> bool:
@@ -90,34 +115,63 @@ class Job(BaseModel):
         return (end - self.started_at).total_seconds()
 
 
-class JobQueue(BaseModel):
-    """Queue of pending and active jobs."""
+@dataclass(slots=True)
+class JobQueue:
+    """Queue of pending and active jobs.
+
+    Jobs are indexed into per-status buckets, kept current via the
+    status-change hook on Job, so queue queries are bucket reads rather
+    than scans over the full (historical) job list.
+    """
 
-    jobs: list[Job] = Field(default_factory=list)
+    jobs: list[Job] = field(default_factory=list)
     max_concurrent: int = 1
+    _by_status: dict[JobStatus, list[Job]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for job in self.jobs:
+            self._register(job)
+
+    def _register(self, job: Job) -> None:
+        self._by_status.setdefault(job.status, []).append(job)
+        job._on_status_change = self._move
+
+    def _move(self, job: Job, old: JobStatus, new: JobStatus) -> None:
+        """Relocate a job between status buckets on transition."""
+        bucket = self._by_status.get(old)
+        if bucket is not None and job in bucket:
+            bucket.remove(job)
+        self._by_status.setdefault(new, []).append(job)
 
     def add(self, job: Job) -> None:
         """Add a job to the queue."""
         self.jobs.append(job)
+        self._register(job)
 
     def get_pending(self) -> list[Job]:
         """Get all pending jobs."""
-        return [j for j in self.jobs if j.status == JobStatus.PENDING]
+        return list(self._by_status.get(JobStatus.PENDING, ()))
 
     def get_active(self) -> list[Job]:
         """Get all active (non-terminal) jobs."""
-        return [j for j in self.jobs if not j.is_terminal]
+        active: list[Job] = []
+        for status in JobStatus:
+            if status not in _TERMINAL_STATUSES:
+                active.extend(self._by_status.get(status, ()))
+        return active
 
     def get_next(self) -> Job | None:
         """Get next job to process, respecting concurrency limit."""
-        active_count = len([j for j in self.jobs if j.status in (
-            JobStatus.SCANNING, JobStatus.RIPPING, JobStatus.ENCODING
-        )])
+        active_count = sum(
+            len(self._by_status.get(s, ())) for s in _ACTIVE_STATUSES
+        )
 
         if active_count >= self.max_concurrent:
             return None
 
-        pending = self.get_pending()
+        pending = self._by_status.get(JobStatus.PENDING)
         return pending[0] if pending else None
 
     def get_by_id(self, job_id: str) -> Job | None:
@@ -129,11 +183,15 @@ class JobQueue(BaseModel):
 
     def cleanup_completed(self, keep_count: int = 10) -> int:
         """Remove old completed jobs, keeping most recent."""
-        completed = [j for j in self.jobs if j.status == JobStatus.COMPLETE]
-        completed.sort(key=lambda j: j.completed_at or datetime.min, reverse=True)
+        completed_bucket = self._by_status.get(JobStatus.COMPLETE, [])
+        completed = sorted(
+            completed_bucket, key=lambda j: j.completed_at or datetime.min, reverse=True
+        )
 
         to_remove = completed[keep_count:]
         for job in to_remove:
             self.jobs.remove(job)
+            completed_bucket.remove(job)
+            job._on_status_change = None
 
         return len(to_remove)
@@ -1,8 +1,45 @@
 """Title-related utilities and extended models."""
 
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Self
+
 from riparr.core.disc import Title
 
 
+@dataclass(slots=True)
+class TitleArrays:
+    """Structure-of-arrays view of the scalar columns the heuristics read.
+
+    Selection heuristics only look at duration, chapters, segment count,
+    and the number of audio tracks. Packing those into flat int columns
+    once per disc lets the repeated analytic passes run over machine
+    ints instead of pulling whole Title objects through the cache.
+    """
+
+    indices: array
+    durations: array
+    chapters: array
+    segment_counts: array
+    audio_counts: array
+
+    @classmethod
+    def from_titles(cls, titles: list[Title]) -> Self:
+        """Build the column arrays from a list of titles."""
+        return cls(
+            indices=array("q", (t.index for t in titles)),
+            durations=array("q", (t.duration for t in titles)),
+            chapters=array("q", (t.chapters for t in titles)),
+            segment_counts=array("q", (t.segment_count for t in titles)),
+            audio_counts=array("q", (len(t.audio_tracks) for t in titles)),
+        )
+
+    def __len__(self) -> int:
+        return len(self.durations)
+
+
 def parse_duration(duration_str: str) -> int:
     """Parse duration string (HH:MM:SS) to seconds.
 
@@ -12,6 +49,15 @@ def parse_duration(duration_str: str) -> int:
     Returns:
         Duration in seconds
     """
+    # MakeMKV emits fixed-width HH:MM:SS; slicing skips the split list
+    # and map iterator allocations on that common shape.
+    if len(duration_str) == 8 and duration_str[2] == ":" and duration_str[5] == ":":
+        return (
+            int(duration_str[0:2]) * 3600
+            + int(duration_str[3:5]) * 60
+            + int(duration_str[6:8])
+        )
+
     parts = duration_str.split(":")
     if len(parts) == 3:
         hours, minutes, seconds = map(int, parts)
@@ -30,6 +76,11 @@ def format_duration(seconds: int) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
+def _durations(titles: list[Title]) -> list[int]:
+    """Extract durations once so heuristics avoid per-comparison attribute lookups."""
+    return [t.duration for t in titles]
+
+
 def is_likely_main_feature(title: Title, all_titles: list[Title]) -> bool:
     """Determine if a title is likely the main feature.
 
@@ -48,7 +99,7 @@ def is_likely_main_feature(title: Title, all_titles: list[Title]) -> bool:
     if not all_titles:
         return False
 
-    max_duration = max(t.duration for t in all_titles)
+    max_duration = max(_durations(all_titles))
 
     # Main feature is usually the longest
     if title.duration == max_duration:
@@ -77,22 +128,27 @@ def is_likely_play_all(title: Title, other_titles: list[Title]) -> bool:
     if not other_titles:
         return False
 
-    # Get titles shorter than this one
-    shorter = [t for t in other_titles if t.duration < title.duration and t.index != title.index]
-
-    if len(shorter) < 2:
+    # Count and sum shorter titles in one pass rather than materializing
+    # a list and re-walking it for len() and sum().
+    duration = title.duration
+    index = title.index
+    shorter_count = 0
+    shorter_sum = 0
+    for t in other_titles:
+        if t.duration < duration and t.index != index:
+            shorter_count += 1
+            shorter_sum += t.duration
+
+    if shorter_count < 2:
         return False
 
     # Check if this title's duration matches sum of shorter titles
     # Allow 5% tolerance for chapter transitions
-    sum_duration = sum(t.duration for t in shorter)
-    tolerance = sum_duration * 0.05
-
-    if abs(title.duration - sum_duration) <= tolerance:
+    if abs(duration - shorter_sum) <= shorter_sum * 0.05:
         return True
 
     # Also check if segments indicate concatenation
-    if title.segment_count > 1 and title.segment_count == len(shorter):
+    if title.segment_count > 1 and title.segment_count == shorter_count:
         return True
 
     return False
@@ -113,16 +169,95 @@ def group_by_duration(titles: list[Title], tolerance_seconds: int = 120) -> list
     if not titles:
         return []
 
-    sorted_titles = sorted(titles, key=lambda t: t.duration)
+    # Sort duration/title pairs so the grouping pass compares plain ints
+    # instead of dereferencing Title attributes on every iteration.
+    durations = _durations(titles)
+    order = sorted(range(len(titles)), key=durations.__getitem__)
+
     groups: list[list[Title]] = []
-    current_group: list[Title] = [sorted_titles[0]]
+    current_group: list[Title] = [titles[order[0]]]
+    group_base = durations[order[0]]
 
-    for title in sorted_titles[1:]:
-        if title.duration - current_group[0].duration <= tolerance_seconds:
-            current_group.append(title)
+    for i in order[1:]:
+        if durations[i] - group_base <= tolerance_seconds:
+            current_group.append(titles[i])
         else:
             groups.append(current_group)
-            current_group = [title]
+            current_group = [titles[i]]
+            group_base = durations[i]
 
     groups.append(current_group)
     return groups
+
+
+def main_feature_mask(arrays: TitleArrays) -> list[bool]:
+    """Mask of titles that pass the main-feature heuristics.
+
+    Column-wise equivalent of `is_likely_main_feature` for every title
+    at once; the max duration is found in a single reduction.
+    """
+    durations = arrays.durations
+    if not durations:
+        return []
+
+    max_duration = max(durations)
+    near_max = max_duration * 0.9
+    return [
+        d == max_duration
+        or (d >= near_max and (arrays.audio_counts[i] > 1 or arrays.chapters[i] >= 10))
+        for i, d in enumerate(durations)
+    ]
+
+
+def play_all_mask(arrays: TitleArrays) -> list[bool]:
+    """Mask of titles that look like play-all concatenations.
+
+    Equivalent to running `is_likely_play_all` for each title against
+    the rest, but the per-candidate shorter-title count and sum come
+    from one sorted array plus prefix sums instead of an O(n) rescan
+    per candidate.
+    """
+    durations = arrays.durations
+    segment_counts = arrays.segment_counts
+
+    sorted_durations = sorted(durations)
+    prefix_sums = [0, *accumulate(sorted_durations)]
+
+    mask: list[bool] = []
+    for i, duration in enumerate(durations):
+        shorter_count = bisect_left(sorted_durations, duration)
+        shorter_sum = prefix_sums[shorter_count]
+        mask.append(
+            shorter_count >= 2
+            and (
+                abs(duration - shorter_sum) <= shorter_sum * 0.05
+                or (segment_counts[i] > 1 and segment_counts[i] == shorter_count)
+            )
+        )
+    return mask
+
+
+def group_indices_by_duration(
+    arrays: TitleArrays, tolerance_seconds: int = 120
+) -> list[list[int]]:
+    """Group title positions by similar duration.
+
+    Index-mask counterpart of `group_by_duration` for callers that
+    already hold a `TitleArrays` view.
+    """
+    durations = arrays.durations
+    if not durations:
+        return []
+
+    order = sorted(range(len(durations)), key=durations.__getitem__)
+    groups: list[list[int]] = [[order[0]]]
+    group_base = durations[order[0]]
+
+    for i in order[1:]:
+        if durations[i] - group_base <= tolerance_seconds:
+            groups[-1].append(i)
+        else:
+            groups.append([i])
+            group_base = durations[i]
+
+    return groups
@@ -4,11 +4,18 @@ This provides real-time disc insertion/removal events on Linux systems
 with access to the udev socket.
 """
 
+import functools
+import os
 from collections.abc import Callable
 
 import anyio
 import structlog
 
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
+
 log = structlog.get_logger()
 
 
@@ -26,8 +33,13 @@ class UdevMonitor:
         self._running = False
 
     @staticmethod
+    @functools.cache
     def is_available() -> bool:
-        """Check if udev monitoring is available.
+        """Check if udev monitoring is available (cached after first probe).
+
+        The watcher asks several times per start; the answer only
+        changes on driver load, so probe once and reuse. Call
+        ``UdevMonitor.is_available.cache_clear()`` to force a re-probe.
 
         Returns:
             True if pyudev can connect to udev socket and we're not in Docker
@@ -37,15 +49,17 @@ class UdevMonitor:
             log.debug("Running in Docker, udev events won't work")
             return False
 
-        try:
-            import pyudev
+        if pyudev is None:
+            log.debug("udev not available", error="pyudev is not installed")
+            return False
 
+        try:
             context = pyudev.Context()
             # Try to create a monitor - this will fail if udev isn't accessible
             monitor = pyudev.Monitor.from_netlink(context)
             del monitor
             return True
-        except (ImportError, OSError, Exception) as e:
+        except (OSError, Exception) as e:
             log.debug("udev not available", error=str(e))
             return False
 
@@ -56,8 +70,6 @@ class UdevMonitor:
         Returns:
             True if running in Docker
         """
-        import os
-
         # Check for .dockerenv file
         if os.path.exists("/.dockerenv"):
             return True
@@ -86,10 +98,8 @@ class UdevMonitor:
             on_remove: Callback when disc is removed (receives device path)
             once: Stop after first insert event
         """
-        try:
-            import pyudev
-        except ImportError as e:
-            raise RuntimeError("pyudev is not installed") from e
+        if pyudev is None:
+            raise RuntimeError("pyudev is not installed")
 
         context = pyudev.Context()
         monitor = pyudev.Monitor.from_netlink(context)
@@ -101,42 +111,40 @@ class UdevMonitor:
 
         log.info("Starting udev monitor", devices=self.devices)
 
-        # Use anyio for async iteration
         monitor.start()
+        fd = monitor.fileno()
 
         try:
             while self._running:
-                # Poll with timeout to allow cancellation
-                device = await anyio.to_thread.run_sync(
-                    lambda: monitor.poll(timeout=1.0)
-                )
-
-                if device is None:
-                    continue
-
-                # Check if this is an optical drive we care about
-                device_path = device.device_node
-                if not device_path:
-                    continue
-
-                if not self._is_optical_drive(device):
-                    continue
-
-                if self.devices and device_path not in self.devices:
-                    continue
-
-                action = device.action
-
-                if action == "change":
-                    # Check if disc was inserted or removed
-                    if self._has_disc(device):
-                        log.debug("Disc inserted event", device=device_path)
-                        on_insert(device_path)
-                        if once:
-                            self._running = False
-                    else:
-                        log.debug("Disc removed event", device=device_path)
-                        on_remove(device_path)
+                # Wake exactly when the netlink socket has data instead
+                # of blocking a thread-pool worker for 1s per iteration.
+                await anyio.wait_readable(fd)
+
+                # Drain all queued events before waiting again
+                while self._running and (device := monitor.poll(timeout=0)) is not None:
+                    # Check if this is an optical drive we care about
+                    device_path = device.device_node
+                    if not device_path:
+                        continue
+
+                    if not self._is_optical_drive(device):
+                        continue
+
+                    if self.devices and device_path not in self.devices:
+                        continue
+
+                    action = device.action
+
+                    if action == "change":
+                        # Check if disc was inserted or removed
+                        if self._has_disc(device):
+                            log.debug("Disc inserted event", device=device_path)
+                            on_insert(device_path)
+                            if once:
+                                self._running = False
+                        else:
+                            log.debug("Disc removed event", device=device_path)
+                            on_remove(device_path)
 
         except Exception as e:
             log.error("udev monitor error", error=str(e))
@@ -194,9 +202,7 @@ async def detect_optical_drives() -> list[dict[str, str]]:
     Returns:
         List of drive info dicts with device path and capabilities
     """
-    try:
-        import pyudev
-    except ImportError:
+    if pyudev is None:
         return []
 
     context = pyudev.Context()
@@ -4,6 +4,7 @@ Automatically selects the best available detection method (udev or polling)
 and provides a unified interface for disc events.
 """
 
+import os
 from collections.abc import Awaitable, Callable
 from typing import Literal
 
@@ -40,6 +41,9 @@ class DiscWatcher:
         self.poll_interval = poll_interval
         self._running = False
         self._selected_method: str | None = None
+        self._backend: UdevMonitor | DevicePoller | None = None
+        self._drive_cache: tuple[int, list[str]] | None = None
+        self._probe_poller: DevicePoller | None = None
 
     async def start(
         self,
@@ -85,28 +89,60 @@ class DiscWatcher:
 
         try:
             if self._selected_method == "udev":
-                # Wrap async callbacks for sync udev monitor (runs in thread)
+                # The udev monitor invokes sync callbacks; enqueue the
+                # events and dispatch the async handlers from a consumer
+                # task. This avoids a blocking round-trip per event and
+                # lets bursts (drive rescan storms) queue up instead of
+                # serializing the monitor.
+                send, recv = anyio.create_memory_object_stream[
+                    tuple[str, str]
+                ](64)
+
                 def sync_on_insert(device: str) -> None:
-                    anyio.from_thread.run(on_insert, device)
+                    send.send_nowait(("insert", device))
 
                 def sync_on_remove(device: str) -> None:
-                    anyio.from_thread.run(on_remove, device)
+                    send.send_nowait(("remove", device))
+
+                async def consume() -> None:
+                    async for action, device in recv:
+                        if action == "insert":
+                            await on_insert(device)
+                        else:
+                            await on_remove(device)
 
                 monitor = UdevMonitor(self.devices)
-                await monitor.monitor(sync_on_insert, sync_on_remove, once=once)
+                self._backend = monitor
+
+                async with anyio.create_task_group() as tg:
+                    tg.start_soon(consume)
+                    try:
+                        await monitor.monitor(
+                            sync_on_insert, sync_on_remove, once=once
+                        )
+                    finally:
+                        # Closing the send side ends the consumer loop
+                        # once queued events are drained.
+                        send.close()
             else:
                 # Poller is fully async, pass callbacks directly
                 poller = DevicePoller(self.devices, interval=self.poll_interval)
+                self._backend = poller
                 await poller.poll(on_insert, on_remove, once=once)
         except Exception as e:
             log.error("Disc watcher error", error=str(e))
             raise
         finally:
-            self._running = False
+            self.stop()
+            self._backend = None
 
     def stop(self) -> None:
         """Stop watching for disc events."""
         self._running = False
+        # Forward to the active backend so its (possibly abandoned)
+        # worker thread exits at its next wakeup.
+        if self._backend is not None:
+            self._backend.stop()
 
     async def _detect_devices(self) -> list[str]:
         """Auto-detect optical drive devices.
@@ -132,8 +168,11 @@ class DiscWatcher:
         Returns:
             True if disc is present
         """
-        poller = DevicePoller([device])
-        return await poller._check_disc(device)
+        # One shared poller per watcher: probes then reuse its mount
+        # table cache instead of re-reading /proc/mounts per device.
+        if self._probe_poller is None:
+            self._probe_poller = DevicePoller(self.devices or [])
+        return await self._probe_poller._check_disc(device)
 
     async def get_drives(self) -> list[dict]:
         """Get list of available optical drives with status.
@@ -145,16 +184,33 @@ class DiscWatcher:
         if UdevMonitor.is_available():
             return await detect_optical_drives()
 
-        # Fall back to basic scan
-        devices = await detect_drives_by_scan()
-        drives = []
+        # Fall back to basic scan. The enumeration is cached against the
+        # sysfs block tree mtime (it only changes on hotplug); disc
+        # presence is dynamic and re-checked on every call.
+        try:
+            mtime = os.stat("/sys/class/block").st_mtime_ns
+        except OSError:
+            mtime = -1
+
+        if mtime >= 0 and self._drive_cache is not None and self._drive_cache[0] == mtime:
+            devices = self._drive_cache[1]
+        else:
+            devices = await detect_drives_by_scan()
+            self._drive_cache = (mtime, devices)
+
+        # Each probe is a blocking ioctl on a worker thread; fan them out
+        # so total latency is the slowest drive, not the sum.
+        drives: list[dict | None] = [None] * len(devices)
 
-        for device in devices:
-            has_disc = await self.check_disc(device)
-            drives.append({
+        async def _probe(i: int, device: str) -> None:
+            drives[i] = {
                 "device": device,
-                "has_disc": has_disc,
-            })
+                "has_disc": await self.check_disc(device),
+            }
+
+        async with anyio.create_task_group() as tg:
+            for i, device in enumerate(devices):
+                tg.start_soon(_probe, i, device)
 
         return drives
 
@@ -176,34 +232,31 @@ async def wait_for_disc(
         TimeoutError: If timeout expires before disc is inserted
     """
     inserted_device: str | None = None
-    event = anyio.Event()
 
     async def on_insert(dev: str) -> None:
         nonlocal inserted_device
         inserted_device = dev
-        event.set()
 
     async def on_remove(dev: str) -> None:
         pass
 
     watcher = DiscWatcher(devices=[device] if device else None)
 
+    # watcher.start(once=True) returns after the first insert, so no
+    # task group or Event round-trip is needed - just bound the await.
     try:
-        async with anyio.create_task_group() as tg:
-            tg.start_soon(watcher.start, on_insert, on_remove, True)
-
-            if timeout:
-                with anyio.move_on_after(timeout) as cancel_scope:
-                    await event.wait()
-                if cancel_scope.cancelled_caught:
-                    watcher.stop()
-                    raise TimeoutError(f"No disc inserted within {timeout} seconds")
-            else:
-                await event.wait()
-
-    except Exception:
+        if timeout:
+            try:
+                with anyio.fail_after(timeout):
+                    await watcher.start(on_insert, on_remove, once=True)
+            except TimeoutError:
+                raise TimeoutError(
+                    f"No disc inserted within {timeout} seconds"
+                ) from None
+        else:
+            await watcher.start(on_insert, on_remove, once=True)
+    finally:
         watcher.stop()
-        raise
 
     if inserted_device is None:
         raise RuntimeError("No device captured")
@@ -1,5 +1,5 @@
 """Video encoding module."""
 
-from riparr.encoder.handbrake import HandBrake, ProgressInfo
+from riparr.encoder.handbrake import EncodeOptions, HandBrake, ProgressInfo
 
-__all__ = ["HandBrake", "ProgressInfo"]
+__all__ = ["EncodeOptions", "HandBrake", "ProgressInfo"]
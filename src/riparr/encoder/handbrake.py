@@ -1,17 +1,25 @@
 """HandBrake async wrapper for video encoding."""
 
 import asyncio
+import codecs
+import os
+import re
+import shutil
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal, Self
 
 import structlog
 
 from riparr.encoder.parser import parse_progress_line
 
+if TYPE_CHECKING:
+    from riparr.config.settings import Settings
 
-@dataclass
+
+@dataclass(slots=True)
 class ProgressInfo:
     """Extended progress information for callbacks."""
 
@@ -22,6 +30,11 @@ class ProgressInfo:
 
 log = structlog.get_logger()
 
+_DURATION_RE = re.compile(r"duration: (\d+:\d+:\d+)", re.IGNORECASE)
+
+# Category headers to drop from --preset-list output.
+_PRESET_CATEGORIES = frozenset({"General", "Web", "Devices", "Matroska"})
+
 
 class HandBrakeError(Exception):
     """HandBrake operation error."""
@@ -32,6 +45,35 @@ class HandBrakeError(Exception):
 VideoCodec = Literal["x264", "x265", "nvenc_h264", "nvenc_h265"]
 
 
+@dataclass(slots=True)
+class EncodeOptions:
+    """Encoding parameters for a HandBrake run.
+
+    One options object replaces the per-call-site mapping of settings
+    fields to encode() keyword arguments.
+    """
+
+    preset: str = "HQ 576p25 Surround"
+    video_codec: VideoCodec = "x265"
+    quality: int = 19
+    encoder_preset: str = "slow"
+    audio_codec: str = "copy"
+    subtitle_scan: bool = True
+    deinterlace: bool = True
+
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> Self:
+        """Build options from application settings."""
+        return cls(
+            preset=settings.handbrake_preset,
+            video_codec=settings.video_codec,
+            quality=settings.video_quality,
+            encoder_preset=settings.encoder_preset,
+            subtitle_scan=settings.subtitle_scan,
+            deinterlace=settings.deinterlace,
+        )
+
+
 class HandBrake:
     """Async wrapper for HandBrakeCLI."""
 
@@ -41,7 +83,12 @@ class HandBrake:
         Args:
             executable: Path to HandBrakeCLI binary
         """
-        self.executable = executable
+        # Resolve through PATH once instead of on every spawn; keep the
+        # original name if not found so the error surfaces at run time.
+        self.executable = shutil.which(executable) or executable
+        # Static argument tails keyed by option values; batch rips
+        # encode many titles with identical options.
+        self._cmd_tails: dict[tuple, tuple[str, ...]] = {}
 
     def _get_encoder_name(self, codec: VideoCodec) -> str:
         """Map codec name to HandBrake encoder name."""
@@ -53,17 +100,55 @@ class HandBrake:
         }
         return mapping.get(codec, "x265")
 
+    def _build_cmd(
+        self, input_path: Path, output_path: Path, options: EncodeOptions
+    ) -> list[str]:
+        """Build the HandBrakeCLI argument list for one encode."""
+        key = (
+            options.preset,
+            options.video_codec,
+            options.quality,
+            options.encoder_preset,
+            options.audio_codec,
+            options.subtitle_scan,
+            options.deinterlace,
+        )
+
+        tail = self._cmd_tails.get(key)
+        if tail is None:
+            args = [
+                "--preset", options.preset,
+                "--encoder", self._get_encoder_name(options.video_codec),
+                "--quality", str(options.quality),
+                "--encoder-preset", options.encoder_preset,
+                "--audio-lang-list", "eng,und",
+                "--first-audio",
+                "--aencoder", options.audio_codec,
+            ]
+
+            # Subtitle scan for forced subs
+            if options.subtitle_scan:
+                args.extend(["--subtitle", "scan", "-F"])
+
+            # Deinterlace (comb detection + decomb)
+            if options.deinterlace:
+                args.extend(["--comb-detect", "--decomb"])
+
+            tail = tuple(args)
+            self._cmd_tails[key] = tail
+
+        return [
+            self.executable,
+            "-i", str(input_path),
+            "-o", str(output_path),
+            *tail,
+        ]
+
     async def encode(
         self,
         input_path: Path,
         output_path: Path,
-        preset: str = "HQ 576p25 Surround",
-        video_codec: VideoCodec = "x265",
-        quality: int = 19,
-        encoder_preset: str = "slow",
-        audio_codec: str = "copy",
-        subtitle_scan: bool = True,
-        deinterlace: bool = True,
+        options: EncodeOptions | None = None,
         progress_callback: Callable[[ProgressInfo], None] | None = None,
     ) -> Path:
         """Encode a video file.
@@ -71,13 +156,7 @@ class HandBrake:
         Args:
             input_path: Path to input MKV file
             output_path: Path for output file
-            preset: HandBrake preset name
-            video_codec: Video encoder to use
-            quality: Video quality (CRF/CQ value)
-            encoder_preset: Encoder speed preset (slow, medium, fast, etc.)
-            audio_codec: Audio codec (copy, aac, ac3, etc.)
-            subtitle_scan: Scan for forced subtitles and burn in
-            deinterlace: Enable comb detection and decomb filter
+            options: Encoding parameters (defaults to EncodeOptions())
             progress_callback: Optional callback for progress updates
 
         Returns:
@@ -86,92 +165,87 @@ class HandBrake:
         Raises:
             HandBrakeError: If encoding fails
         """
-        if not input_path.exists():
+        if not os.path.exists(input_path):
             raise HandBrakeError(f"Input file not found: {input_path}")
 
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        encoder = self._get_encoder_name(video_codec)
-
-        cmd = [
-            self.executable,
-            "-i", str(input_path),
-            "-o", str(output_path),
-            "--preset", preset,
-            "--encoder", encoder,
-            "--quality", str(quality),
-            "--encoder-preset", encoder_preset,
-            "--audio-lang-list", "eng,und",
-            "--first-audio",
-        ]
-
-        # Audio handling
-        if audio_codec == "copy":
-            cmd.extend(["--aencoder", "copy"])
-        else:
-            cmd.extend(["--aencoder", audio_codec])
-
-        # Subtitle scan for forced subs
-        if subtitle_scan:
-            cmd.extend(["--subtitle", "scan", "-F"])
+        if options is None:
+            options = EncodeOptions()
 
-        # Deinterlace (comb detection + decomb)
-        if deinterlace:
-            cmd.extend(["--comb-detect", "--decomb"])
+        cmd = self._build_cmd(input_path, output_path, options)
 
         log.info(
             "Starting encode",
             input=input_path.name,
             output=output_path.name,
-            encoder=encoder,
-            quality=quality,
+            encoder=self._get_encoder_name(options.video_codec),
+            quality=options.quality,
         )
 
         try:
+            # Generous stream limit: x265 stats lines can exceed the
+            # 64KiB default and stall the reader on log bursts.
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
+                limit=1 << 20,
+                # Keeps CPython on the posix_spawn fast path (no fork);
+                # our fds are non-inheritable anyway (PEP 446).
+                close_fds=False,
             )
 
             assert process.stdout is not None
 
             last_progress: float = 0.0
+            last_stage = ""
+            last_emit_ts = 0.0
             buffer = ""
-
-            # HandBrake uses \r for progress updates, not \n
-            # Read in chunks and split on both \r and \n
+            # Stateful decoder: carries multibyte sequences split across
+            # chunk boundaries instead of replacing them, and skips the
+            # per-call decoder setup of bytes.decode.
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+            # HandBrake uses \r for progress updates, not \n.
+            # Read large chunks and split the whole buffer once per
+            # chunk rather than rescanning it per line.
             while True:
-                chunk = await process.stdout.read(1024)
+                chunk = await process.stdout.read(65536)
                 if not chunk:
                     break
 
-                buffer += chunk.decode("utf-8", errors="replace")
-
-                # Split on \r or \n
-                while "\r" in buffer or "\n" in buffer:
-                    # Find the first separator
-                    r_pos = buffer.find("\r")
-                    n_pos = buffer.find("\n")
+                buffer += decoder.decode(chunk)
 
-                    if r_pos == -1:
-                        sep_pos = n_pos
-                    elif n_pos == -1:
-                        sep_pos = r_pos
-                    else:
-                        sep_pos = min(r_pos, n_pos)
+                if "\r" not in buffer and "\n" not in buffer:
+                    continue
 
-                    line = buffer[:sep_pos].strip()
-                    buffer = buffer[sep_pos + 1:]
+                # Normalize \r to \n and split in one pass; the last
+                # element is the trailing partial line.
+                *lines, buffer = buffer.replace("\r", "\n").split("\n")
 
+                for raw_line in lines:
+                    line = raw_line.strip()
                     if not line:
                         continue
 
                     progress = parse_progress_line(line)
                     if progress and progress_callback:
-                        # Only report significant progress changes
-                        if progress.percent - last_progress >= 0.5:
+                        # Coalesce updates: require both a meaningful
+                        # percent delta and a wall-clock gap so bursts
+                        # of uneven progress lines can't storm the
+                        # callback. Stage transitions and the final
+                        # 100% always go through.
+                        now = time.monotonic()
+                        if (
+                            progress.stage != last_stage
+                            or progress.percent >= 100.0
+                            or (
+                                progress.percent - last_progress >= 0.5
+                                and now - last_emit_ts >= 0.2
+                            )
+                        ):
                             info = ProgressInfo(
                                 percent=progress.percent,
                                 fps=progress.fps,
@@ -180,19 +254,26 @@ class HandBrake:
                             )
                             progress_callback(info)
                             last_progress = progress.percent
+                            last_stage = progress.stage
+                            last_emit_ts = now
 
             returncode = await process.wait()
 
             if returncode != 0:
                 raise HandBrakeError(f"HandBrake failed with code {returncode}")
 
-            if not output_path.exists():
-                raise HandBrakeError(f"Output file not created: {output_path}")
+            # One stat covers both the existence check and the size.
+            try:
+                size = os.stat(output_path).st_size
+            except FileNotFoundError:
+                raise HandBrakeError(
+                    f"Output file not created: {output_path}"
+                ) from None
 
             log.info(
                 "Encode complete",
                 output=output_path.name,
-                size_mb=output_path.stat().st_size / (1024 * 1024),
+                size_mb=size / (1024 * 1024),
             )
 
             return output_path
@@ -220,6 +301,7 @@ class HandBrake:
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                close_fds=False,
             )
 
             stdout, _ = await process.communicate()
@@ -231,7 +313,7 @@ class HandBrake:
                 line = line.strip()
                 if line and not line.startswith("<") and not line.endswith(">"):
                     # Filter out category headers
-                    if "/" not in line and line not in ("General", "Web", "Devices", "Matroska"):
+                    if "/" not in line and line not in _PRESET_CATEGORIES:
                         presets.append(line)
 
             return presets
@@ -261,6 +343,7 @@ class HandBrake:
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
+                close_fds=False,
             )
 
             stdout, _ = await process.communicate()
@@ -278,19 +361,21 @@ class HandBrake:
 
             for line in output.splitlines():
                 line = line.strip()
+                # Scans produce thousands of lines; lowercase each one
+                # exactly once for the substring checks below.
+                lower = line.lower()
 
                 # Duration
-                if "duration:" in line.lower():
-                    import re
-                    match = re.search(r"duration: (\d+:\d+:\d+)", line, re.IGNORECASE)
+                if "duration:" in lower:
+                    match = _DURATION_RE.search(line)
                     if match:
                         info["duration"] = match.group(1)
 
                 # Video codec
-                if "video codec" in line.lower() or "stream #" in line.lower():
-                    if "h.264" in line.lower() or "avc" in line.lower():
+                if "video codec" in lower or "stream #" in lower:
+                    if "h.264" in lower or "avc" in lower:
                         info["video_codec"] = "H.264"
-                    elif "h.265" in line.lower() or "hevc" in line.lower():
+                    elif "h.265" in lower or "hevc" in lower:
                         info["video_codec"] = "H.265"
 
             return info
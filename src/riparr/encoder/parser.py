@@ -3,8 +3,17 @@
 import re
 from dataclasses import dataclass
 
+# Compiled once; progress lines arrive at tens of Hz for the duration
+# of an encode, so per-line re.search cache lookups add up.
+_ENCODING_RE = re.compile(
+    r"Encoding: task (\d+) of (\d+), ([\d.]+) %"
+    r"(?: \(([\d.]+) fps, avg ([\d.]+) fps, ETA (\S+)\))?"
+)
+_MUX_RE = re.compile(r"Muxing: ([\d.]+) %")
+_SCAN_RE = re.compile(r"Scanning title (\d+) of (\d+)")
 
-@dataclass
+
+@dataclass(slots=True)
 class EncodeProgress:
     """Encoding progress information."""
 
@@ -31,45 +40,40 @@ def parse_progress_line(line: str) -> EncodeProgress | None:
     Returns:
         EncodeProgress if line contains progress info, None otherwise
     """
-    progress = EncodeProgress()
+    # Dispatch on the prefix so each line runs at most one anchored
+    # match; everything else (the bulk of HandBrake's output) is
+    # rejected without touching a regex. Lines are stripped upstream.
 
     # Main encoding progress
     # Format: Encoding: task N of M, XX.XX % (XX.XX fps, avg XX.XX fps, ETA XXhXXmXXs)
-    encoding_match = re.search(
-        r"Encoding: task (\d+) of (\d+), ([\d.]+) %"
-        r"(?: \(([\d.]+) fps, avg ([\d.]+) fps, ETA (\S+)\))?",
-        line,
-    )
-    if encoding_match:
-        progress.pass_num = int(encoding_match.group(1))
-        progress.total_passes = int(encoding_match.group(2))
-        progress.percent = float(encoding_match.group(3))
-        progress.stage = "encoding"
-
-        if encoding_match.group(4):
-            progress.fps = float(encoding_match.group(4))
-        if encoding_match.group(5):
-            progress.avg_fps = float(encoding_match.group(5))
-        if encoding_match.group(6):
-            progress.eta = encoding_match.group(6)
-
-        return progress
+    if line.startswith("Encoding:"):
+        encoding_match = _ENCODING_RE.match(line)
+        if encoding_match:
+            return EncodeProgress(
+                pass_num=int(encoding_match.group(1)),
+                total_passes=int(encoding_match.group(2)),
+                percent=float(encoding_match.group(3)),
+                fps=float(encoding_match.group(4) or 0.0),
+                avg_fps=float(encoding_match.group(5) or 0.0),
+                eta=encoding_match.group(6) or "",
+                stage="encoding",
+            )
+        return None
 
     # Muxing progress
-    mux_match = re.search(r"Muxing: ([\d.]+) %", line)
-    if mux_match:
-        progress.percent = float(mux_match.group(1))
-        progress.stage = "muxing"
-        return progress
+    if line.startswith("Muxing:"):
+        mux_match = _MUX_RE.match(line)
+        if mux_match:
+            return EncodeProgress(percent=float(mux_match.group(1)), stage="muxing")
+        return None
 
     # Scanning progress
-    scan_match = re.search(r"Scanning title (\d+) of (\d+)", line)
-    if scan_match:
-        current = int(scan_match.group(1))
-        total = int(scan_match.group(2))
-        progress.percent = (current / total) * 100
-        progress.stage = "scanning"
-        return progress
+    if line.startswith("Scanning"):
+        scan_match = _SCAN_RE.match(line)
+        if scan_match:
+            current = int(scan_match.group(1))
+            total = int(scan_match.group(2))
+            return EncodeProgress(percent=(current / total) * 100, stage="scanning")
 
     return None
 
@@ -0,0 +1,54 @@
+"""Lazy logging facade.
+
+CLI fast paths (``--help``, ``--version``) should never pay for the
+structlog import or its configuration resolution. Modules obtain a
+logger via :func:`get_logger`, which forwards to a zero-cost no-op
+logger until :func:`install_real_logger` swaps in the real structlog
+logger (done from ``configure_logging`` once a command actually runs).
+"""
+
+from typing import Any
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    return None
+
+
+class _NoopLogger:
+    """Logger stand-in that swallows every call."""
+
+    def __getattr__(self, name: str) -> Any:
+        return _noop
+
+
+_logger: Any = _NoopLogger()
+
+
+def install_real_logger() -> None:
+    """Replace the no-op logger with the real structlog logger."""
+    global _logger
+
+    import structlog
+
+    _logger = structlog.get_logger()
+
+
+class _LoggerProxy:
+    """Forwards attribute access to whichever logger is installed.
+
+    Module-level ``log = get_logger()`` bindings stay valid across the
+    no-op → structlog swap because lookups go through this proxy.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_logger, name)
+
+
+_proxy = _LoggerProxy()
+
+
+def get_logger() -> Any:
+    """Get the process-wide logger facade."""
+    return _proxy
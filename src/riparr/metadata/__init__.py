@@ -3,5 +3,6 @@
 from riparr.metadata.arm_api import lookup_disc
 from riparr.metadata.dvdid import compute_dvd_id
 from riparr.metadata.mediainfo import get_media_info
+from riparr.metadata.resolve import resolve_metadata
 
-__all__ = ["compute_dvd_id", "get_media_info", "lookup_disc"]
+__all__ = ["compute_dvd_id", "get_media_info", "lookup_disc", "resolve_metadata"]
@@ -0,0 +1,181 @@
+"""Cache for metadata lookup results.
+
+ARM and TMDB responses for a given disc hash or (title, year) are
+stable on the timescale of a rip session, so successful lookups are
+memoized in process and persisted to a small SQLite database in the
+user cache directory with a TTL. Retries and restarts then resolve
+from the cache instead of re-hitting the network.
+"""
+
+import atexit
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import orjson
+import structlog
+
+from riparr.core.disc import DiscMetadata, MediaType
+
+log = structlog.get_logger()
+
+# One week: long enough to cover a rip session and its retries, short
+# enough that corrected upstream metadata eventually propagates.
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_MAX_MEMORY_ENTRIES = 512
+
+
+def _default_cache_path() -> Path:
+    """Return the on-disk cache location (XDG aware)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "riparr" / "metadata.sqlite"
+
+
+def _serialize(metadata: DiscMetadata) -> bytes:
+    """Serialize metadata to JSON bytes.
+
+    orjson walks the dataclass fields in C; only the MediaType enum
+    goes through the default hook.
+    """
+    return orjson.dumps(metadata, default=lambda o: o.value)
+
+
+def _deserialize(payload: bytes) -> DiscMetadata:
+    """Reconstruct metadata from JSON bytes."""
+    data = orjson.loads(payload)
+    data["media_type"] = MediaType(data["media_type"])
+    return DiscMetadata(**data)
+
+
+class MetadataCache:
+    """Two-level (memory + SQLite) cache for lookup results."""
+
+    def __init__(self, path: Path | None = None, ttl: float = CACHE_TTL_SECONDS) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file location. Defaults to the user cache dir.
+            ttl: Entry lifetime in seconds.
+        """
+        self.path = path or _default_cache_path()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._memory: dict[str, DiscMetadata] = {}
+        self._conn: sqlite3.Connection | None = None
+        self._disabled = False
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """Open (or return) the SQLite connection; None if unavailable."""
+        if self._disabled:
+            return None
+        if self._conn is None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.path)
+                # WAL keeps concurrent readers off the writer's lock
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS lookups ("
+                    "key TEXT PRIMARY KEY, payload BLOB NOT NULL, ts REAL NOT NULL)"
+                )
+                self._conn.commit()
+            except (OSError, sqlite3.Error) as e:
+                # Cache is an optimization; lookups still work without it.
+                log.debug("Metadata cache unavailable", error=str(e))
+                self._disabled = True
+                self._conn = None
+        return self._conn
+
+    def get(self, key: str) -> DiscMetadata | None:
+        """Return the cached metadata for key, or None on miss/expiry."""
+        cached = self._memory.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+
+        conn = self._connect()
+        if conn is None:
+            return None
+
+        try:
+            row = conn.execute(
+                "SELECT payload, ts FROM lookups WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        payload, ts = row
+        if time.time() - ts >= self.ttl:
+            try:
+                conn.execute("DELETE FROM lookups WHERE key = ?", (key,))
+                conn.commit()
+            except sqlite3.Error:
+                pass
+            return None
+
+        try:
+            metadata = _deserialize(payload)
+        except (orjson.JSONDecodeError, TypeError, ValueError):
+            return None
+
+        # Disk hit: correct the miss counted above
+        self.misses -= 1
+        self.hits += 1
+        self._remember(key, metadata)
+        return metadata
+
+    def set(self, key: str, metadata: DiscMetadata) -> None:
+        """Store a successful lookup result."""
+        self._remember(key, metadata)
+
+        conn = self._connect()
+        if conn is None:
+            return
+
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO lookups (key, payload, ts) VALUES (?, ?, ?)",
+                (key, _serialize(metadata), time.time()),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            log.debug("Metadata cache write failed", error=str(e))
+
+    def _remember(self, key: str, metadata: DiscMetadata) -> None:
+        """Insert into the in-memory layer, evicting the oldest entry."""
+        self._memory.pop(key, None)
+        self._memory[key] = metadata
+        if len(self._memory) > _MAX_MEMORY_ENTRIES:
+            self._memory.pop(next(iter(self._memory)))
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_cache: MetadataCache | None = None
+
+
+def get_cache() -> MetadataCache:
+    """Return the shared metadata cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = MetadataCache()
+        if os.environ.get("RIPARR_CACHE_STATS"):
+            atexit.register(_log_stats, _cache)
+    return _cache
+
+
+def _log_stats(cache: MetadataCache) -> None:
+    """Log hit/miss counts at exit (RIPARR_CACHE_STATS=1)."""
+    log.info("Metadata cache stats", hits=cache.hits, misses=cache.misses)
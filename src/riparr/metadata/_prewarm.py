@@ -0,0 +1,44 @@
+"""Background prewarm of heavy metadata libraries.
+
+pydvdid_m and pymediainfo are imported lazily at their call sites so
+CLI startup stays fast, but the first disc then pays the import plus
+the libmediainfo dlopen (easily 100-300 ms) on the event loop.
+Commands that will certainly need them kick this off in a daemon
+thread, so the first real call finds everything already loaded.
+"""
+
+import threading
+
+import structlog
+
+log = structlog.get_logger()
+
+
+def _prewarm() -> None:
+    """Import the metadata libraries and force the libmediainfo dlopen."""
+    # Purely opportunistic; real calls surface their own errors, so a
+    # missing library just means its prewarm is skipped.
+    try:
+        import pydvdid_m  # noqa: F401
+    except Exception as e:
+        log.debug("pydvdid_m prewarm skipped", error=str(e))
+
+    try:
+        from pymediainfo import MediaInfo
+
+        # Importing pymediainfo does not load the shared library; a
+        # trivial parse does.
+        MediaInfo.parse("/dev/null")
+    except Exception as e:
+        log.debug("pymediainfo prewarm skipped", error=str(e))
+
+
+def prewarm_metadata_libs() -> threading.Thread:
+    """Start the library prewarm in a daemon thread.
+
+    Returns:
+        The started thread (daemonized; never joined in normal flow)
+    """
+    thread = threading.Thread(target=_prewarm, name="riparr-prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -8,9 +8,34 @@ import structlog
 
 from riparr.config import get_settings
 from riparr.core.disc import DiscMetadata, MediaType
+from riparr.metadata._cache import get_cache
 
 log = structlog.get_logger()
 
+# Shared client so repeated lookups reuse pooled keep-alive connections
+# instead of paying a TCP+TLS handshake per call.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            transport=httpx.AsyncHTTPTransport(retries=3),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client (for clean shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class ARMApiError(Exception):
     """ARM API error."""
@@ -27,58 +52,65 @@ async def lookup_disc(dvd_id: str) -> DiscMetadata | None:
     Returns:
         DiscMetadata if found, None otherwise
     """
+    cache = get_cache()
+    cache_key = f"arm:{dvd_id}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        log.debug("ARM lookup served from cache", dvd_id=dvd_id)
+        return cached
+
     settings = get_settings()
     url = f"{settings.arm_api_url}/api/v1/search/{dvd_id}"
 
     log.debug("Looking up disc in ARM database", dvd_id=dvd_id, url=url)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url)
-
-            if response.status_code == 404:
-                log.debug("Disc not found in ARM database", dvd_id=dvd_id)
-                return None
-
-            response.raise_for_status()
-            data = response.json()
-
-            if not data or "results" not in data:
-                return None
-
-            results = data.get("results", [])
-            if not results:
-                return None
-
-            # Use first result
-            result = results[0]
-
-            # Parse media type
-            media_type_str = result.get("video_type", "").lower()
-            if media_type_str == "movie":
-                media_type = MediaType.MOVIE
-            elif media_type_str in ("tv", "series", "episode"):
-                media_type = MediaType.TV
-            else:
-                media_type = MediaType.UNKNOWN
-
-            metadata = DiscMetadata(
-                title=result.get("title", "Unknown"),
-                year=result.get("year"),
-                media_type=media_type,
-                imdb_id=result.get("imdb_id"),
-                tmdb_id=result.get("tmdb_id"),
-                poster_url=result.get("poster_url"),
-            )
-
-            log.info(
-                "Found disc metadata",
-                title=metadata.title,
-                year=metadata.year,
-                media_type=metadata.media_type.value,
-            )
-
-            return metadata
+        response = await _get_client().get(url)
+
+        if response.status_code == 404:
+            log.debug("Disc not found in ARM database", dvd_id=dvd_id)
+            return None
+
+        response.raise_for_status()
+        data = response.json()
+
+        if not data or "results" not in data:
+            return None
+
+        results = data.get("results", [])
+        if not results:
+            return None
+
+        # Use first result
+        result = results[0]
+
+        # Parse media type
+        media_type_str = result.get("video_type", "").lower()
+        if media_type_str == "movie":
+            media_type = MediaType.MOVIE
+        elif media_type_str in ("tv", "series", "episode"):
+            media_type = MediaType.TV
+        else:
+            media_type = MediaType.UNKNOWN
+
+        metadata = DiscMetadata(
+            title=result.get("title", "Unknown"),
+            year=result.get("year"),
+            media_type=media_type,
+            imdb_id=result.get("imdb_id"),
+            tmdb_id=result.get("tmdb_id"),
+            poster_url=result.get("poster_url"),
+        )
+
+        log.info(
+            "Found disc metadata",
+            title=metadata.title,
+            year=metadata.year,
+            media_type=metadata.media_type.value,
+        )
+
+        cache.set(cache_key, metadata)
+        return metadata
 
     except httpx.HTTPStatusError as e:
         log.warning("ARM API request failed", status=e.response.status_code, error=str(e))
@@ -127,12 +159,11 @@ async def submit_disc(
     log.debug("Submitting disc to ARM database", dvd_id=dvd_id, title=title)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, json=data)
-            response.raise_for_status()
+        response = await _get_client().post(url, json=data)
+        response.raise_for_status()
 
-            log.info("Disc submitted to ARM database", dvd_id=dvd_id, title=title)
-            return True
+        log.info("Disc submitted to ARM database", dvd_id=dvd_id, title=title)
+        return True
 
     except httpx.HTTPError as e:
         log.warning("Failed to submit disc to ARM", error=str(e))
@@ -1,5 +1,8 @@
 """Media file analysis using pymediainfo."""
 
+import functools
+import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -7,8 +10,32 @@ import structlog
 
 log = structlog.get_logger()
 
-
-@dataclass
+# Substring -> display name rules for codec_string, checked in order
+# (first match wins); hoisted so the property does one linear pass
+# instead of a branch cascade of upper()/in chains.
+_VIDEO_CODEC_RULES = (
+    ("HEVC", "H265"),
+    ("H.265", "H265"),
+    ("AVC", "H264"),
+    ("H.264", "H264"),
+)
+_HDR_RULES = (
+    ("Dolby Vision", "DV"),
+    ("HDR10+", "HDR10+"),
+    ("HDR", "HDR"),
+)
+_AUDIO_CODEC_RULES = (
+    ("TRUEHD", "TrueHD"),
+    ("DTS-HD", "DTS-HD"),
+    ("DTS:X", "DTS-HD"),
+    ("DTS", "DTS"),
+    ("AC3", "DD"),
+    ("AC-3", "DD"),
+    ("AAC", "AAC"),
+)
+
+
+@dataclass(slots=True)
 class VideoInfo:
     """Video stream information."""
 
@@ -21,7 +48,7 @@ class VideoInfo:
     duration_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioInfo:
     """Audio stream information."""
 
@@ -32,7 +59,7 @@ class AudioInfo:
     title: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleInfo:
     """Subtitle stream information."""
 
@@ -42,7 +69,7 @@ class SubtitleInfo:
     title: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MediaInfo:
     """Complete media file information."""
 
@@ -53,6 +80,11 @@ class MediaInfo:
     audio_tracks: list[AudioInfo] = field(default_factory=list)
     subtitle_tracks: list[SubtitleInfo] = field(default_factory=list)
 
+    # Cached codec_string; instances are read-only after parsing
+    _codec_string: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def duration_str(self) -> str:
         """Duration as HH:MM:SS string."""
@@ -76,48 +108,107 @@ class MediaInfo:
     @property
     def codec_string(self) -> str:
         """Generate codec string for filename (e.g., H265 DTS-HD)."""
+        if self._codec_string is None:
+            self._codec_string = self._build_codec_string()
+        return self._codec_string
+
+    def _build_codec_string(self) -> str:
+        """Build the codec string from the rule tables."""
         parts = []
 
         if self.video:
             video_codec = self.video.codec.upper()
-            if "HEVC" in video_codec or "H.265" in video_codec:
-                parts.append("H265")
-            elif "AVC" in video_codec or "H.264" in video_codec:
-                parts.append("H264")
+            for needle, name in _VIDEO_CODEC_RULES:
+                if needle in video_codec:
+                    parts.append(name)
+                    break
             else:
                 parts.append(video_codec.split()[0])
 
             if self.video.hdr_format:
-                if "Dolby Vision" in self.video.hdr_format:
-                    parts.append("DV")
-                elif "HDR10+" in self.video.hdr_format:
-                    parts.append("HDR10+")
-                elif "HDR" in self.video.hdr_format:
-                    parts.append("HDR")
+                for needle, name in _HDR_RULES:
+                    if needle in self.video.hdr_format:
+                        parts.append(name)
+                        break
 
         if self.audio_tracks:
             audio = self.audio_tracks[0]
             audio_codec = audio.codec.upper()
-            if "TRUEHD" in audio_codec or "TrueHD" in audio.codec:
-                if "Atmos" in audio.title:
-                    parts.append("Atmos")
-                else:
-                    parts.append("TrueHD")
-            elif "DTS-HD" in audio_codec or "DTS:X" in audio_codec:
-                parts.append("DTS-HD")
-            elif "DTS" in audio_codec:
-                parts.append("DTS")
-            elif "AC3" in audio_codec or "AC-3" in audio_codec:
-                parts.append("DD")
-            elif "AAC" in audio_codec:
-                parts.append("AAC")
+            for needle, name in _AUDIO_CODEC_RULES:
+                if needle in audio_codec:
+                    if name == "TrueHD" and "Atmos" in audio.title:
+                        parts.append("Atmos")
+                    else:
+                        parts.append(name)
+                    break
 
         return " ".join(parts) if parts else "Unknown"
 
 
+def _handle_general(track, result: MediaInfo) -> None:
+    """Fold a General track into the result."""
+    result.duration_ms = int(track.duration or 0)
+    result.container = track.format or ""
+
+
+def _handle_video(track, result: MediaInfo) -> None:
+    """Fold a Video track into the result."""
+    result.video = VideoInfo(
+        codec=track.format or "",
+        width=int(track.width or 0),
+        height=int(track.height or 0),
+        frame_rate=float(track.frame_rate or 0),
+        bit_depth=int(track.bit_depth or 8),
+        hdr_format=track.hdr_format or track.hdr_format_commercial,
+        duration_ms=int(track.duration or 0),
+    )
+
+
+def _handle_audio(track, result: MediaInfo) -> None:
+    """Fold an Audio track into the result.
+
+    Codec and language values have very low cardinality; interning
+    dedups them across tracks and files.
+    """
+    result.audio_tracks.append(
+        AudioInfo(
+            codec=sys.intern(track.format or ""),
+            channels=int(track.channel_s or 2),
+            sample_rate=int(track.sampling_rate or 48000),
+            language=sys.intern(track.language or "und"),
+            title=track.title or "",
+        )
+    )
+
+
+def _handle_text(track, result: MediaInfo) -> None:
+    """Fold a Text (subtitle) track into the result."""
+    result.subtitle_tracks.append(
+        SubtitleInfo(
+            codec=sys.intern(track.format or ""),
+            language=sys.intern(track.language or "und"),
+            forced=bool(track.forced),
+            title=track.title or "",
+        )
+    )
+
+
+# O(1) dispatch on track_type; files can carry dozens of tracks
+_TRACK_HANDLERS = {
+    "General": _handle_general,
+    "Video": _handle_video,
+    "Audio": _handle_audio,
+    "Text": _handle_text,
+}
+
+
 def get_media_info(file_path: Path) -> MediaInfo | None:
     """Analyze a media file using pymediainfo.
 
+    Results are memoized by (path, mtime, size), so re-querying an
+    unchanged file is a stat plus a dict lookup instead of a full
+    libmediainfo parse.
+
     Args:
         file_path: Path to the media file
 
@@ -125,56 +216,43 @@ def get_media_info(file_path: Path) -> MediaInfo | None:
         MediaInfo object or None if analysis fails
     """
     try:
-        from pymediainfo import MediaInfo as PyMediaInfo
+        st = os.stat(file_path)
+    except OSError:
+        log.warning("File not found", path=str(file_path))
+        return None
+
+    return _get_media_info_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_media_info_cached(path: str, mtime_ns: int, size: int) -> MediaInfo | None:
+    """Parse a media file; cached until the file's mtime or size changes.
 
-        if not file_path.exists():
-            log.warning("File not found", path=str(file_path))
-            return None
+    Args:
+        path: Path to the media file
+        mtime_ns: File modification time (cache key)
+        size: File size in bytes
+
+    Returns:
+        MediaInfo object or None if analysis fails
+    """
+    try:
+        from pymediainfo import MediaInfo as PyMediaInfo
 
-        mi = PyMediaInfo.parse(str(file_path))
+        mi = PyMediaInfo.parse(path)
 
         result = MediaInfo(
-            size_bytes=file_path.stat().st_size,
+            size_bytes=size,
         )
 
         for track in mi.tracks:
-            if track.track_type == "General":
-                result.duration_ms = int(track.duration or 0)
-                result.container = track.format or ""
-
-            elif track.track_type == "Video":
-                result.video = VideoInfo(
-                    codec=track.format or "",
-                    width=int(track.width or 0),
-                    height=int(track.height or 0),
-                    frame_rate=float(track.frame_rate or 0),
-                    bit_depth=int(track.bit_depth or 8),
-                    hdr_format=track.hdr_format or track.hdr_format_commercial,
-                    duration_ms=int(track.duration or 0),
-                )
-
-            elif track.track_type == "Audio":
-                audio = AudioInfo(
-                    codec=track.format or "",
-                    channels=int(track.channel_s or 2),
-                    sample_rate=int(track.sampling_rate or 48000),
-                    language=track.language or "und",
-                    title=track.title or "",
-                )
-                result.audio_tracks.append(audio)
-
-            elif track.track_type == "Text":
-                subtitle = SubtitleInfo(
-                    codec=track.format or "",
-                    language=track.language or "und",
-                    forced=bool(track.forced),
-                    title=track.title or "",
-                )
-                result.subtitle_tracks.append(subtitle)
+            handler = _TRACK_HANDLERS.get(track.track_type)
+            if handler:
+                handler(track, result)
 
         log.debug(
             "Media info parsed",
-            path=file_path.name,
+            path=os.path.basename(path),
             duration=result.duration_str,
             video=result.video.codec if result.video else None,
             audio_tracks=len(result.audio_tracks),
@@ -186,5 +264,5 @@ def get_media_info(file_path: Path) -> MediaInfo | None:
         log.error("pymediainfo not installed")
         return None
     except Exception as e:
-        log.error("Failed to parse media info", path=str(file_path), error=str(e))
+        log.error("Failed to parse media info", path=path, error=str(e))
         return None
@@ -0,0 +1,55 @@
+"""Combined metadata resolution across ARM and TMDB."""
+
+import anyio
+import structlog
+
+from riparr.core.disc import DiscMetadata
+from riparr.metadata.arm_api import lookup_disc
+from riparr.metadata.tmdb import search as tmdb_search
+
+log = structlog.get_logger()
+
+
+async def resolve_metadata(
+    dvd_id: str | None,
+    title_hint: str | None = None,
+    year: int | None = None,
+    media_type: str | None = None,
+) -> DiscMetadata | None:
+    """Resolve disc metadata from ARM and TMDB concurrently.
+
+    Both services are independent and network-bound, so the lookups
+    race instead of running back to back. An ARM hit (keyed on the
+    exact disc hash) is authoritative and cancels the fuzzier TMDB
+    title search; otherwise the TMDB result is used.
+
+    Args:
+        dvd_id: Disc CRC64 hash for the ARM lookup, if known
+        title_hint: Title to search on TMDB, if known
+        year: Optional year for the TMDB search
+        media_type: Optional TMDB type (movie, tv)
+
+    Returns:
+        DiscMetadata if either source found a match, None otherwise
+    """
+    arm_result: DiscMetadata | None = None
+    tmdb_result: DiscMetadata | None = None
+
+    async with anyio.create_task_group() as tg:
+
+        async def _arm() -> None:
+            nonlocal arm_result
+            arm_result = await lookup_disc(dvd_id)
+            if arm_result is not None:
+                tg.cancel_scope.cancel()
+
+        async def _tmdb() -> None:
+            nonlocal tmdb_result
+            tmdb_result = await tmdb_search(title_hint, year, media_type)
+
+        if dvd_id:
+            tg.start_soon(_arm)
+        if title_hint:
+            tg.start_soon(_tmdb)
+
+    return arm_result or tmdb_result
@@ -1,16 +1,88 @@
 """TMDB (The Movie Database) API client for metadata lookup."""
 
+import functools
+
+import anyio
 import httpx
 import structlog
 
 from riparr.config import get_settings
 from riparr.core.disc import DiscMetadata, MediaType
+from riparr.metadata._cache import get_cache
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
 
 log = structlog.get_logger()
 
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 TMDB_IMAGE_BASE = "https://image.tmdb.org/t/p/w500"
 
+# Shared client so a metadata lookup's multiple requests (and repeated
+# lookups) reuse one pooled TLS connection instead of handshaking per call.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        # With the h2 extra installed, concurrent lookups multiplex on
+        # one TLS connection instead of opening a socket each.
+        _client = httpx.AsyncClient(
+            base_url=TMDB_BASE_URL,
+            http2=_HTTP2,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            transport=httpx.AsyncHTTPTransport(retries=3),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client (for clean shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+async def _get_with_retry(url: str, params: dict, attempts: int = 3) -> httpx.Response:
+    """GET with exponential backoff on rate limiting and server errors.
+
+    Honors Retry-After on 429 so bursts of lookups back off instead of
+    thrashing TMDB's rate limit.
+
+    Args:
+        url: Request path (relative to the client base URL)
+        params: Query parameters
+        attempts: Maximum number of tries
+
+    Returns:
+        The final response (which may still carry an error status)
+    """
+    client = _get_client()
+    for attempt in range(attempts):
+        response = await client.get(url, params=params)
+        if response.status_code not in _RETRY_STATUSES or attempt == attempts - 1:
+            break
+
+        retry_after = response.headers.get("Retry-After")
+        try:
+            delay = float(retry_after) if retry_after else 2.0**attempt
+        except ValueError:
+            delay = 2.0**attempt
+        await anyio.sleep(delay)
+
+    return response
+
 
 class TMDBError(Exception):
     """TMDB API error."""
@@ -34,6 +106,13 @@ async def search_movie(title: str, year: int | None = None) -> DiscMetadata | No
         log.debug("TMDB API key not configured")
         return None
 
+    cache = get_cache()
+    cache_key = f"tmdb:movie:{title}:{year}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        log.debug("TMDB movie lookup served from cache", title=title)
+        return cached
+
     params = {
         "api_key": settings.tmdb_api_key,
         "query": title,
@@ -44,37 +123,34 @@ async def search_movie(title: str, year: int | None = None) -> DiscMetadata | No
         params["year"] = str(year)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{TMDB_BASE_URL}/search/movie",
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            results = data.get("results", [])
-            if not results:
-                log.debug("No TMDB results for movie", title=title)
-                return None
-
-            # Use first result
-            movie = results[0]
-
-            # Get external IDs (IMDB)
-            imdb_id = await _get_external_ids("movie", movie["id"])
-
-            metadata = DiscMetadata(
-                title=movie.get("title", title),
-                year=_parse_year(movie.get("release_date")),
-                media_type=MediaType.MOVIE,
-                imdb_id=imdb_id,
-                tmdb_id=movie.get("id"),
-                poster_url=_get_poster_url(movie.get("poster_path")),
-                overview=movie.get("overview"),
-            )
-
-            log.info("Found movie on TMDB", title=metadata.title, year=metadata.year)
-            return metadata
+        response = await _get_with_retry("/search/movie", params)
+        response.raise_for_status()
+        data = response.json()
+
+        results = data.get("results", [])
+        if not results:
+            log.debug("No TMDB results for movie", title=title)
+            return None
+
+        # Use first result
+        movie = results[0]
+
+        # Get external IDs (IMDB) in one details round trip
+        details = await _get_details("movie", movie["id"], settings.tmdb_api_key)
+
+        metadata = DiscMetadata(
+            title=movie.get("title", title),
+            year=_parse_year(movie.get("release_date")),
+            media_type=MediaType.MOVIE,
+            imdb_id=details.get("external_ids", {}).get("imdb_id"),
+            tmdb_id=movie.get("id"),
+            poster_url=_get_poster_url(movie.get("poster_path")),
+            overview=movie.get("overview"),
+        )
+
+        log.info("Found movie on TMDB", title=metadata.title, year=metadata.year)
+        cache.set(cache_key, metadata)
+        return metadata
 
     except httpx.HTTPError as e:
         log.warning("TMDB search failed", error=str(e))
@@ -97,6 +173,13 @@ async def search_tv(title: str, year: int | None = None) -> DiscMetadata | None:
         log.debug("TMDB API key not configured")
         return None
 
+    cache = get_cache()
+    cache_key = f"tmdb:tv:{title}:{year}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        log.debug("TMDB TV lookup served from cache", title=title)
+        return cached
+
     params = {
         "api_key": settings.tmdb_api_key,
         "query": title,
@@ -107,105 +190,71 @@ async def search_tv(title: str, year: int | None = None) -> DiscMetadata | None:
         params["first_air_date_year"] = str(year)
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{TMDB_BASE_URL}/search/tv",
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            results = data.get("results", [])
-            if not results:
-                log.debug("No TMDB results for TV series", title=title)
-                return None
-
-            # Use first result
-            show = results[0]
-
-            # Get external IDs (IMDB)
-            imdb_id = await _get_external_ids("tv", show["id"])
-
-            # Get season/episode info
-            show_details = await _get_tv_details(show["id"])
-
-            metadata = DiscMetadata(
-                title=show.get("name", title),
-                year=_parse_year(show.get("first_air_date")),
-                media_type=MediaType.TV,
-                imdb_id=imdb_id,
-                tmdb_id=show.get("id"),
-                poster_url=_get_poster_url(show.get("poster_path")),
-                overview=show.get("overview"),
-                episode_count=show_details.get("number_of_episodes"),
-            )
-
-            log.info("Found TV series on TMDB", title=metadata.title, year=metadata.year)
-            return metadata
+        response = await _get_with_retry("/search/tv", params)
+        response.raise_for_status()
+        data = response.json()
+
+        results = data.get("results", [])
+        if not results:
+            log.debug("No TMDB results for TV series", title=title)
+            return None
+
+        # Use first result
+        show = results[0]
+
+        # Get external IDs (IMDB) and episode count in one details round trip
+        details = await _get_details("tv", show["id"], settings.tmdb_api_key)
+
+        metadata = DiscMetadata(
+            title=show.get("name", title),
+            year=_parse_year(show.get("first_air_date")),
+            media_type=MediaType.TV,
+            imdb_id=details.get("external_ids", {}).get("imdb_id"),
+            tmdb_id=show.get("id"),
+            poster_url=_get_poster_url(show.get("poster_path")),
+            overview=show.get("overview"),
+            episode_count=details.get("number_of_episodes"),
+        )
+
+        log.info("Found TV series on TMDB", title=metadata.title, year=metadata.year)
+        cache.set(cache_key, metadata)
+        return metadata
 
     except httpx.HTTPError as e:
         log.warning("TMDB search failed", error=str(e))
         return None
 
 
-async def _get_external_ids(media_type: str, tmdb_id: int) -> str | None:
-    """Get external IDs (IMDB) for a TMDB entry.
+async def _get_details(media_type: str, tmdb_id: int, api_key: str) -> dict:
+    """Get details for a TMDB entry, with external IDs appended.
 
-    Args:
-        media_type: "movie" or "tv"
-        tmdb_id: TMDB ID
-
-    Returns:
-        IMDB ID or None
-    """
-    settings = get_settings()
-
-    if not settings.tmdb_api_key:
-        return None
-
-    try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{TMDB_BASE_URL}/{media_type}/{tmdb_id}/external_ids",
-                params={"api_key": settings.tmdb_api_key},
-            )
-            response.raise_for_status()
-            data = response.json()
-            return data.get("imdb_id")
-
-    except httpx.HTTPError:
-        return None
-
-
-async def _get_tv_details(tmdb_id: int) -> dict:
-    """Get TV series details.
+    TMDB's ``append_to_response=external_ids`` folds the IMDB ID (and,
+    for TV, the episode count already on the details payload) into one
+    round trip instead of two or three.
 
     Args:
+        media_type: "movie" or "tv"
         tmdb_id: TMDB ID
+        api_key: TMDB API key
 
     Returns:
-        Dict with series details
+        Dict with details, or empty dict on error
     """
-    settings = get_settings()
-
-    if not settings.tmdb_api_key:
-        return {}
-
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{TMDB_BASE_URL}/tv/{tmdb_id}",
-                params={"api_key": settings.tmdb_api_key},
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await _get_with_retry(
+            f"/{media_type}/{tmdb_id}",
+            {"api_key": api_key, "append_to_response": "external_ids"},
+        )
+        response.raise_for_status()
+        return response.json()
 
     except httpx.HTTPError:
         return {}
 
 
+@functools.lru_cache(maxsize=2048)
 def _parse_year(date_str: str | None) -> int | None:
-    """Parse year from date string (YYYY-MM-DD)."""
+    """Parse year from date string (YYYY-MM-DD); dates repeat across queries."""
     if date_str and len(date_str) >= 4:
         try:
             return int(date_str[:4])
@@ -214,8 +263,9 @@ def _parse_year(date_str: str | None) -> int | None:
     return None
 
 
+@functools.lru_cache(maxsize=2048)
 def _get_poster_url(poster_path: str | None) -> str | None:
-    """Get full poster URL from path."""
+    """Get full poster URL from path; posters recur across seasons."""
     if poster_path:
         return f"{TMDB_IMAGE_BASE}{poster_path}"
     return None
@@ -5,6 +5,7 @@ Generates Plex/Jellyfin compatible directory structures:
 - TV: Series {imdb-ttXXXX}/Season XX/Series - SXXEXX - Episode [codecs].mkv
 """
 
+import functools
 import re
 from pathlib import Path
 
@@ -15,11 +16,53 @@ from riparr.core.disc import Disc, DiscMetadata, MediaType
 
 log = structlog.get_logger()
 
-
+# Fixed character-set deletion/replacement is a single C-level
+# translate pass; no regex engine needed for those. Compiled patterns
+# cover the rest, built once at import since sanitization runs several
+# times per ripped title.
+_INVALID_CHARS_TRANS = str.maketrans("", "", '<>:"/\\|?*')
+_DOT_UNDERSCORE_TRANS = str.maketrans("._", "  ")
+_WHITESPACE_RE = re.compile(r"\s+")
+_YEAR_RE = re.compile(r"[\._\s](\d{4})[\._\s]?")
+
+# Substring -> label rules for codec strings, first match wins; one
+# linear pass over the uppercased value instead of a branch cascade
+# (same shape as the tables in riparr.metadata.mediainfo).
+_VIDEO_CODEC_RULES = (
+    ("265", "H265"),
+    ("HEVC", "H265"),
+    ("264", "H264"),
+    ("AVC", "H264"),
+)
+_AUDIO_CODEC_RULES = (
+    ("TRUEHD", "TrueHD"),
+    ("DTS-HD", "DTS-HD"),
+    ("DTS:X", "DTS-HD"),
+    ("DTS", "DTS"),
+    ("AC3", "DD"),
+    ("AC-3", "DD"),
+    ("AAC", "AAC"),
+)
+
+# Episode-number patterns for metadata-less filenames, fused into one
+# alternation so the stem is scanned once instead of once per pattern.
+# Group number doubles as priority (1 = strongest signal).
+_EPISODE_RE = re.compile(
+    r"[Ee](\d{1,2})"  # 1: E01, e01
+    r"|[Xx](\d{1,2})"  # 2: x01
+    r"|_(\d{1,2})(?:_|\.)"  # 3: _01_ or _01.
+    r"|[Tt](\d{1,2})"  # 4: T01, t01 (MakeMKV title number)
+    r"|(\d{1,2})(?:of|OF)\d+"  # 5: 01of10
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def sanitize_filename(name: str) -> str:
     """Sanitize a string for use as a filename.
 
     Removes or replaces characters that are invalid on most filesystems.
+    Memoized: the same disc title is sanitized for the folder name, the
+    filename, and every processed-disc pattern, several times per title.
 
     Args:
         name: Original filename
@@ -27,12 +70,11 @@ def sanitize_filename(name: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Replace invalid characters
-    invalid_chars = r'[<>:"/\\|?*]'
-    name = re.sub(invalid_chars, "", name)
+    # Remove invalid characters
+    name = name.translate(_INVALID_CHARS_TRANS)
 
     # Replace multiple spaces with single space
-    name = re.sub(r"\s+", " ", name)
+    name = _WHITESPACE_RE.sub(" ", name)
 
     # Strip leading/trailing whitespace and dots
     name = name.strip(" .")
@@ -61,14 +103,8 @@ def generate_folder_name(
     """
     title = sanitize_filename(title)
 
-    if year and imdb_id:
-        return f"{title} ({year}) {{imdb-{imdb_id}}}"
-    elif year:
-        return f"{title} ({year})"
-    elif imdb_id:
-        return f"{title} {{imdb-{imdb_id}}}"
-    else:
-        return title
+    prefix = f"{title} ({year})" if year else title
+    return f"{prefix} {{imdb-{imdb_id}}}" if imdb_id else prefix
 
 
 def generate_folder_name_from_metadata(metadata: DiscMetadata) -> str:
@@ -144,15 +180,18 @@ class OutputNamer:
         metadata = disc.metadata
         assert metadata is not None
 
-        folder_name = generate_folder_name_from_metadata(metadata)
+        # Folder and filename share the "Title (Year)" prefix; building
+        # it once keeps this to two string constructions (the folder
+        # format matches generate_folder_name)
         title = sanitize_filename(metadata.title)
-        year = metadata.year
+        prefix = f"{title} ({metadata.year})" if metadata.year else title
 
-        # Build filename
-        if codec_string:
-            filename = f"{title} ({year}) [{codec_string}].mkv" if year else f"{title} [{codec_string}].mkv"
-        else:
-            filename = f"{title} ({year}).mkv" if year else f"{title}.mkv"
+        folder_name = (
+            f"{prefix} {{imdb-{metadata.imdb_id}}}" if metadata.imdb_id else prefix
+        )
+        filename = (
+            f"{prefix} [{codec_string}].mkv" if codec_string else f"{prefix}.mkv"
+        )
 
         return self.output_dir / "Movies" / folder_name / filename
 
@@ -224,12 +263,12 @@ class OutputNamer:
         name = sanitize_filename(name)
 
         # Try to parse year from name
-        year_match = re.search(r"[\._\s](\d{4})[\._\s]?", name)
+        year_match = _YEAR_RE.search(name)
         year = int(year_match.group(1)) if year_match else None
 
         # Clean up the name
-        name = re.sub(r"[\._]", " ", name)
-        name = re.sub(r"\s+", " ", name).strip()
+        name = name.translate(_DOT_UNDERSCORE_TRANS)
+        name = _WHITESPACE_RE.sub(" ", name).strip()
 
         folder_name = generate_folder_name(name, year)
 
@@ -251,21 +290,18 @@ class OutputNamer:
         Returns:
             Episode number (defaults to 1)
         """
-        # Try to extract from filename patterns
-        patterns = [
-            r"[Ee](\d{1,2})",  # E01, e01
-            r"[Xx](\d{1,2})",  # x01
-            r"_(\d{1,2})(?:_|\.)",  # _01_ or _01.
-            r"[Tt](\d{1,2})",  # T01, t01 (title number)
-            r"(\d{1,2})(?:of|OF)\d+",  # 01of10
-        ]
-
-        filename = source_file.stem
-
-        for pattern in patterns:
-            match = re.search(pattern, filename)
-            if match:
-                return int(match.group(1))
+        # Single scan; keep the strongest (lowest-numbered) group so a
+        # late E01 still beats an earlier title-number match.
+        best: tuple[int, str] | None = None
+        for match in _EPISODE_RE.finditer(source_file.stem):
+            group = match.lastindex or 1
+            if best is None or group < best[0]:
+                best = (group, match.group(group))
+                if group == 1:
+                    break
+
+        if best is not None:
+            return int(best[1])
 
         # Fall back to title number
         if title_num is not None:
@@ -275,9 +311,12 @@ class OutputNamer:
         return 1
 
 
+@functools.lru_cache(maxsize=256)
 def generate_codec_string(video_codec: str, audio_codec: str, hdr: bool = False) -> str:
     """Generate a codec string for filenames.
 
+    Memoized: a disc's titles usually share one codec combination.
+
     Args:
         video_codec: Video codec (e.g., "H.265", "AVC")
         audio_codec: Audio codec (e.g., "DTS-HD MA", "TrueHD")
@@ -289,12 +328,13 @@ def generate_codec_string(video_codec: str, audio_codec: str, hdr: bool = False)
     parts = []
 
     # Video codec
-    if "265" in video_codec or "hevc" in video_codec.lower():
-        parts.append("H265")
-    elif "264" in video_codec or "avc" in video_codec.lower():
-        parts.append("H264")
+    video_upper = video_codec.upper()
+    for needle, label in _VIDEO_CODEC_RULES:
+        if needle in video_upper:
+            parts.append(label)
+            break
     else:
-        parts.append(video_codec.upper()[:6])
+        parts.append(video_upper[:6])
 
     # HDR
     if hdr:
@@ -302,18 +342,12 @@ def generate_codec_string(video_codec: str, audio_codec: str, hdr: bool = False)
 
     # Audio codec
     audio_upper = audio_codec.upper()
-    if "TRUEHD" in audio_upper:
-        if "ATMOS" in audio_upper:
-            parts.append("Atmos")
-        else:
-            parts.append("TrueHD")
-    elif "DTS-HD" in audio_upper or "DTS:X" in audio_upper:
-        parts.append("DTS-HD")
-    elif "DTS" in audio_upper:
-        parts.append("DTS")
-    elif "AC3" in audio_upper or "AC-3" in audio_upper:
-        parts.append("DD")
-    elif "AAC" in audio_upper:
-        parts.append("AAC")
+    for needle, label in _AUDIO_CODEC_RULES:
+        if needle in audio_upper:
+            if label == "TrueHD" and "ATMOS" in audio_upper:
+                parts.append("Atmos")
+            else:
+                parts.append(label)
+            break
 
     return " ".join(parts)
@@ -7,7 +7,10 @@ and automatic recovery of interrupted jobs.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import functools
+import os
+import subprocess
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -15,10 +18,9 @@ import anyio
 import structlog
 
 from riparr.config.settings import Settings
-from riparr.core.disc import Disc
+from riparr.core.disc import Disc, DiscMetadata
 from riparr.core.job import Job, JobStatus
-from riparr.encoder.handbrake import HandBrake
-from riparr.metadata.arm_api import lookup_disc
+from riparr.encoder.handbrake import EncodeOptions, HandBrake
 from riparr.metadata.dvdid import compute_dvd_id
 from riparr.output.naming import (
     OutputNamer,
@@ -36,6 +38,51 @@ if TYPE_CHECKING:
 log = structlog.get_logger()
 
 
+async def _mkdir(path: Path) -> None:
+    """Create a directory tree on a worker thread.
+
+    mkdir(parents=True) can mean several round trips on slow or network
+    storage; doing it inline would stall every other rip/encode task.
+
+    Args:
+        path: Directory to create
+    """
+    await anyio.to_thread.run_sync(lambda: path.mkdir(parents=True, exist_ok=True))
+
+
+def _remove_empty_dir(path: Path) -> None:
+    """Remove a directory if it exists and is empty."""
+    if path.exists() and not any(path.iterdir()):
+        path.rmdir()
+
+
+def _dir_mtime(path: Path) -> int:
+    """Directory mtime in nanoseconds, or -1 if unavailable."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _has_mkv(path: Path) -> bool:
+    """Check whether a directory contains an MKV file.
+
+    One scandir with an early exit; a missing directory counts as no,
+    which also stands in for a separate exists() call.
+
+    Args:
+        path: Directory to check
+
+    Returns:
+        True if the directory holds at least one .mkv file
+    """
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.name.endswith(".mkv") for entry in entries)
+    except OSError:
+        return False
+
+
 class QueueManager:
     """Orchestrate rip and encode operations."""
 
@@ -55,12 +102,25 @@ class QueueManager:
         self.markers = MarkerManager(settings.raw_dir)
         self.makemkv = MakeMKV(settings.makemkv_path, license_key=settings.makemkv_key)
         self.handbrake = HandBrake(settings.handbrake_path)
+        self.encode_options = EncodeOptions.from_settings(settings)
         self.selector = TitleSelector(settings)
         self.namer = OutputNamer(settings)
 
         self._rip_semaphore = asyncio.Semaphore(settings.max_concurrent_rips)
         self._encode_semaphore = asyncio.Semaphore(settings.max_concurrent_encodes)
         self._running = False
+        self._last_rip_emit = 0.0
+        # Set whenever this manager adds ready markers, so the queue
+        # processor wakes immediately instead of on its next poll
+        self._ready_event = asyncio.Event()
+
+        # Already-processed verdicts per disc identity; each check costs
+        # several directory scans, and the same disc can be re-checked
+        # (reinsertion, queue passes) within one session.
+        self._processed_cache: dict[tuple[str, int | None, str | None], bool] = {}
+        # Folder names under raw_dir/output_dir that hold MKVs, keyed by
+        # the roots' mtimes; makes the processed check a set lookup.
+        self._folder_cache: tuple[tuple[int, int], set[str]] | None = None
 
     async def process_disc(self, device: str, encode: bool = False) -> Job:
         """Process a disc from start to finish.
@@ -76,7 +136,7 @@ class QueueManager:
 
         # Start with a temporary device-based directory (will be renamed after metadata lookup)
         temp_disc_dir = self.settings.raw_dir / f"disc_{device.replace('/', '_')}"
-        temp_disc_dir.mkdir(parents=True, exist_ok=True)
+        await _mkdir(temp_disc_dir)
 
         job = Job(
             disc=Disc(device=device),
@@ -98,16 +158,15 @@ class QueueManager:
             # Update output directory to use metadata-based naming
             disc_dir = self._get_disc_output_dir(disc, device)
             if disc_dir != temp_disc_dir:
-                disc_dir.mkdir(parents=True, exist_ok=True)
+                await _mkdir(disc_dir)
                 # Remove the empty temp directory if it was just created
-                if temp_disc_dir.exists() and not any(temp_disc_dir.iterdir()):
-                    temp_disc_dir.rmdir()
+                await anyio.to_thread.run_sync(_remove_empty_dir, temp_disc_dir)
                 job.output_dir = disc_dir
             else:
                 disc_dir = temp_disc_dir
 
-            # Check if already processed
-            if self._is_already_processed(disc):
+            # Check if already processed (several directory scans)
+            if await anyio.to_thread.run_sync(self._is_already_processed, disc):
                 disc_name = disc.metadata.title if disc.metadata else disc.name or "Unknown"
                 log.info("Disc already processed, skipping", disc=disc_name)
                 if self.tracker:
@@ -146,16 +205,27 @@ class QueueManager:
             if self.tracker:
                 self.tracker.complete_rip()
 
-            # Mark files ready for encoding
-            for mkv_file in ripped_files:
-                metadata = {
-                    "disc_name": disc.name,
-                    "dvd_id": disc.dvd_id,
-                    "title": disc.metadata.title if disc.metadata else None,
-                    "year": disc.metadata.year if disc.metadata else None,
-                    "imdb_id": disc.metadata.imdb_id if disc.metadata else None,
-                }
-                self.markers.create_marker(mkv_file, "ready", metadata=metadata)
+            # Mark files ready for encoding; the metadata is shared by
+            # the whole batch, and one write pass beats a marker-cache
+            # invalidation per file
+            marker_metadata = {
+                "disc_name": disc.name,
+                "dvd_id": disc.dvd_id,
+                "title": disc.metadata.title if disc.metadata else None,
+                "year": disc.metadata.year if disc.metadata else None,
+                "imdb_id": disc.metadata.imdb_id if disc.metadata else None,
+            }
+            await anyio.to_thread.run_sync(
+                lambda: self.markers.create_markers(
+                    ripped_files, "ready", metadata=marker_metadata
+                )
+            )
+            self._ready_event.set()
+
+            # The disc's folder now holds ripped files, so a reinsertion
+            # must see it as processed regardless of any cached miss.
+            if disc.metadata is not None:
+                self._processed_cache[self._processed_key(disc.metadata)] = True
 
             # Eject disc
             if self.settings.eject_after_rip:
@@ -188,62 +258,48 @@ class QueueManager:
         return job
 
     async def _lookup_metadata(self, disc: Disc, device: str) -> None:
-        """Look up disc metadata using multiple methods.
+        """Look up disc metadata.
 
-        Tries in order:
-        1. DVD ID → ARM database lookup
-        2. TMDB search by disc name
+        The DVD ID → ARM lookup and the TMDB search by disc name run
+        concurrently; an ARM hit wins.
 
         Args:
             disc: Disc object to update
             device: Device path
         """
-        from riparr.metadata.tmdb import search as tmdb_search
+        from riparr.metadata.resolve import resolve_metadata
 
-        # Method 1: Try DVD ID → ARM database
+        dvd_id: str | None = None
         try:
-            dvd_id = compute_dvd_id(device)
+            # CRC over the disc's IFO files; optical reads must not
+            # block the event loop
+            dvd_id = await anyio.to_thread.run_sync(compute_dvd_id, device)
             disc.dvd_id = dvd_id
             log.info("Computed DVD ID", dvd_id=dvd_id)
+        except Exception as e:
+            log.debug("DVD ID computation failed", error=str(e))
 
-            metadata = await lookup_disc(dvd_id)
-            if metadata:
-                disc.metadata = metadata
-                log.info(
-                    "Found metadata via ARM",
-                    title=metadata.title,
-                    year=metadata.year,
-                )
-                if self.tracker:
-                    self.tracker.add_event(
-                        f"Found: [cyan]{metadata.title}[/] ({metadata.year})"
-                    )
-                return  # Success, no need to try other methods
+        # Clean up disc name for search (replace underscores, etc.)
+        search_title = disc.name.replace("_", " ").strip() if disc.name else None
+
+        try:
+            metadata = await resolve_metadata(dvd_id, title_hint=search_title)
         except Exception as e:
-            log.debug("DVD ID lookup failed", error=str(e))
+            log.debug("Metadata lookup failed", error=str(e))
+            metadata = None
 
-        # Method 2: Try TMDB search by disc name
-        if disc.name:
-            try:
-                # Clean up disc name for search (replace underscores, etc.)
-                search_title = disc.name.replace("_", " ").strip()
-                log.info("Searching TMDB by disc name", title=search_title)
-
-                metadata = await tmdb_search(search_title)
-                if metadata:
-                    disc.metadata = metadata
-                    log.info(
-                        "Found metadata via TMDB",
-                        title=metadata.title,
-                        year=metadata.year,
-                    )
-                    if self.tracker:
-                        self.tracker.add_event(
-                            f"Found: [cyan]{metadata.title}[/] ({metadata.year})"
-                        )
-                    return  # Success
-            except Exception as e:
-                log.debug("TMDB search failed", error=str(e))
+        if metadata:
+            disc.metadata = metadata
+            log.info(
+                "Found disc metadata",
+                title=metadata.title,
+                year=metadata.year,
+            )
+            if self.tracker:
+                self.tracker.add_event(
+                    f"Found: [cyan]{metadata.title}[/] ({metadata.year})"
+                )
+            return
 
         # All methods failed
         log.warning("All metadata lookup methods failed", disc_name=disc.name)
@@ -270,23 +326,14 @@ class QueueManager:
                     progress=f"{idx}/{len(job.selected_titles)}",
                 )
 
-                # Progress callback for tracker
-                def make_progress_callback(title_idx: int) -> Callable[[float], None]:
-                    def callback(progress: float) -> None:
-                        if self.tracker:
-                            # Calculate overall progress
-                            base = ((title_idx - 1) / len(job.selected_titles)) * 100
-                            title_contrib = (progress / len(job.selected_titles))
-                            overall = base + title_contrib
-                            self.tracker.update_rip(title_idx, overall)
-                    return callback
-
                 try:
                     output_file = await self.makemkv.rip_title(
                         job.disc.device,
                         title.index,
                         job.output_dir,
-                        progress_callback=make_progress_callback(idx),
+                        progress_callback=functools.partial(
+                            self._rip_progress, idx, len(job.selected_titles)
+                        ),
                     )
                     ripped_files.append(output_file)
                 except Exception as e:
@@ -298,15 +345,58 @@ class QueueManager:
 
         return ripped_files
 
+    def _rip_progress(self, title_idx: int, total: int, progress: float) -> None:
+        """Forward rip progress to the tracker, throttled to ~10 Hz.
+
+        Bound-method callback shared across titles (one partial per
+        title instead of a fresh closure); titles rip sequentially, so
+        a single throttle timestamp on the manager is enough.
+
+        Args:
+            title_idx: 1-based index of the title being ripped
+            total: Number of titles selected for ripping
+            progress: Per-title progress percentage
+        """
+        if not self.tracker:
+            return
+
+        now = time.monotonic()
+        if progress < 100.0 and now - self._last_rip_emit < 0.1:
+            return
+        self._last_rip_emit = now
+
+        # Calculate overall progress
+        base = ((title_idx - 1) / total) * 100
+        overall = base + progress / total
+        self.tracker.update_rip(title_idx, overall)
+
     async def _encode_files(self, job: Job) -> None:
-        """Encode ripped files.
+        """Encode ripped files, fanning out up to max_concurrent_encodes.
 
         Args:
             job: Job containing files to encode
         """
-        for mkv_file in job.output_files:
+        async with anyio.create_task_group() as tg:
+            for mkv_file in job.output_files:
+                tg.start_soon(self._encode_one, job, mkv_file)
+
+        # Clear encode status when done with all files
+        if self.tracker:
+            self.tracker.clear_encode()
+
+    async def _encode_one(self, job: Job, mkv_file: Path) -> None:
+        """Encode a single ripped file.
+
+        Holds an encode slot for the whole pipeline, so a queued file
+        isn't marked transcoding until an encoder is actually free.
+
+        Args:
+            job: Job the file belongs to
+            mkv_file: Ripped MKV to encode
+        """
+        async with self._encode_semaphore:
             if not mkv_file.exists():
-                continue
+                return
 
             self.markers.update_status(mkv_file, "transcoding")
 
@@ -315,7 +405,7 @@ class QueueManager:
 
             try:
                 output_path = self.namer.get_output_path(job.disc, mkv_file)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                await _mkdir(output_path.parent)
 
                 # Progress callback for tracker
                 def encode_progress_callback(info) -> None:
@@ -326,25 +416,19 @@ class QueueManager:
                             eta=info.eta,
                         )
 
-                async with self._encode_semaphore:
-                    await self.handbrake.encode(
-                        mkv_file,
-                        output_path,
-                        preset=self.settings.handbrake_preset,
-                        video_codec=self.settings.video_codec,
-                        quality=self.settings.video_quality,
-                        encoder_preset=self.settings.encoder_preset,
-                        deinterlace=self.settings.deinterlace,
-                        subtitle_scan=self.settings.subtitle_scan,
-                        progress_callback=encode_progress_callback,
-                    )
+                await self.handbrake.encode(
+                    mkv_file,
+                    output_path,
+                    options=self.encode_options,
+                    progress_callback=encode_progress_callback,
+                )
 
                 self.markers.update_status(mkv_file, "complete")
                 log.info("Encoded file", input=mkv_file.name, output=str(output_path))
 
                 # Clean up raw file if enabled
                 if self.settings.delete_raw_after_encode:
-                    self._cleanup_raw_file(mkv_file)
+                    await anyio.to_thread.run_sync(self._cleanup_raw_file, mkv_file)
 
                 if self.tracker:
                     self.tracker.complete_encode()
@@ -356,18 +440,12 @@ class QueueManager:
                 if self.tracker:
                     self.tracker.fail_encode(str(e))
 
-        # Clear encode status when done with all files
-        if self.tracker:
-            self.tracker.clear_encode()
-
     async def _eject_disc(self, device: str) -> None:
         """Eject disc from drive.
 
         Args:
             device: Device path
         """
-        import subprocess
-
         try:
             await anyio.to_thread.run_sync(
                 lambda: subprocess.run(["eject", device], capture_output=True)
@@ -388,24 +466,36 @@ class QueueManager:
         Returns:
             Output directory path
         """
+        # The sanitized name is cached on the disc, keyed by the title
+        # it came from (metadata can land between calls)
+        source = disc.metadata.title if disc.metadata else disc.name
+        cached = disc._folder_name
+        if cached is not None and cached[0] == source:
+            return self.settings.raw_dir / cached[1]
+
         if disc.metadata:
             folder_name = generate_folder_name_from_metadata(disc.metadata)
-            return self.settings.raw_dir / folder_name
-
-        # Fallback to disc name if available
-        if disc.name:
+        elif disc.name:
             name = sanitize_filename(disc.name)
             name = name.replace("_", " ").replace(".", " ")
-            name = " ".join(name.split())  # Normalize whitespace
-            return self.settings.raw_dir / name
+            folder_name = " ".join(name.split())  # Normalize whitespace
+        else:
+            # Last resort: device-based name
+            folder_name = f"disc_{device.replace('/', '_')}"
+
+        disc._folder_name = (source, folder_name)
+        return self.settings.raw_dir / folder_name
 
-        # Last resort: device-based name
-        return self.settings.raw_dir / f"disc_{device.replace('/', '_')}"
+    @staticmethod
+    def _processed_key(metadata: DiscMetadata) -> tuple[str, int | None, str | None]:
+        """Cache key identifying a disc for processed-state checks."""
+        return (metadata.title, metadata.year, metadata.imdb_id)
 
     def _is_already_processed(self, disc: Disc) -> bool:
         """Check if a disc has already been processed.
 
-        Checks both raw_dir and output_dir for existing folders matching the disc.
+        Checks both raw_dir and output_dir for existing folders matching
+        the disc; verdicts are cached per disc identity for the session.
 
         Args:
             disc: Disc object with metadata
@@ -418,6 +508,10 @@ class QueueManager:
             return False
 
         metadata = disc.metadata
+        key = self._processed_key(metadata)
+        cached = self._processed_cache.get(key)
+        if cached is not None:
+            return cached
 
         # Build possible folder name patterns (most specific to least)
         patterns = [
@@ -428,22 +522,59 @@ class QueueManager:
         # Remove duplicates while preserving order
         patterns = list(dict.fromkeys(patterns))
 
-        # Check raw_dir
-        for pattern in patterns:
-            raw_path = self.settings.raw_dir / pattern
-            if raw_path.exists() and any(raw_path.glob("*.mkv")):
-                log.debug("Found in raw_dir", path=str(raw_path))
-                return True
+        processed = self._scan_processed_dirs(patterns)
+        self._processed_cache[key] = processed
+        return processed
+
+    def _scan_processed_dirs(self, patterns: list[str]) -> bool:
+        """Look for ripped/encoded output under the candidate folder names.
 
-        # Check output_dir (Movies subfolder)
+        Args:
+            patterns: Candidate folder names, most specific first
+
+        Returns:
+            True if any candidate folder contains an MKV file
+        """
+        known = self._known_folders()
         for pattern in patterns:
-            output_path = self.settings.output_dir / "Movies" / pattern
-            if output_path.exists() and any(output_path.glob("*.mkv")):
-                log.debug("Found in output_dir", path=str(output_path))
+            if pattern in known:
+                log.debug("Disc folder already present", folder=pattern)
                 return True
-
         return False
 
+    def _known_folders(self) -> set[str]:
+        """Names of folders under raw_dir and output_dir/Movies with MKVs.
+
+        Built in one walk and cached against the roots' mtimes (which
+        change whenever a folder is added or removed), turning each
+        processed check into set lookups instead of directory scans.
+        Only folders that already contain an MKV count: process_disc
+        creates the disc's empty folder before this check runs.
+
+        Returns:
+            Set of folder names holding at least one MKV file
+        """
+        roots = (self.settings.raw_dir, self.settings.output_dir / "Movies")
+
+        key = tuple(_dir_mtime(root) for root in roots)
+        cached = self._folder_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        known: set[str] = set()
+        for root in roots:
+            try:
+                entries = os.scandir(root)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir() and _has_mkv(Path(entry.path)):
+                        known.add(entry.name)
+
+        self._folder_cache = (key, known)
+        return known
+
     def _cleanup_raw_file(self, mkv_file: Path) -> None:
         """Clean up raw file and marker after successful encoding.
 
@@ -479,8 +610,14 @@ class QueueManager:
             job_info = self.markers.get_next_ready()
 
             if job_info is None:
-                # No pending jobs, wait and check again
-                await anyio.sleep(5)
+                # Wait for a local rip to signal new work; the timeout
+                # keeps a periodic rescan for markers dropped by other
+                # processes (e.g. a manual queue retry) — get_next_ready
+                # sees those because its cache is keyed on the marker
+                # tree's signature, not just base_dir's mtime
+                with anyio.move_on_after(5):
+                    await self._ready_event.wait()
+                self._ready_event.clear()
                 continue
 
             log.info("Processing queued file", name=job_info.name)
@@ -499,7 +636,7 @@ class QueueManager:
                         disc.dvd_id = dvd_id
 
                 output_path = self.namer.get_output_path(disc, job_info.path)
-                output_path.parent.mkdir(parents=True, exist_ok=True)
+                await _mkdir(output_path.parent)
 
                 def encode_progress_callback(info) -> None:
                     if self.tracker:
@@ -513,12 +650,7 @@ class QueueManager:
                     await self.handbrake.encode(
                         job_info.path,
                         output_path,
-                        preset=self.settings.handbrake_preset,
-                        video_codec=self.settings.video_codec,
-                        quality=self.settings.video_quality,
-                        encoder_preset=self.settings.encoder_preset,
-                        deinterlace=self.settings.deinterlace,
-                        subtitle_scan=self.settings.subtitle_scan,
+                        options=self.encode_options,
                         progress_callback=encode_progress_callback,
                     )
 
@@ -527,7 +659,7 @@ class QueueManager:
 
                 # Clean up raw file if enabled
                 if self.settings.delete_raw_after_encode:
-                    self._cleanup_raw_file(job_info.path)
+                    await anyio.to_thread.run_sync(self._cleanup_raw_file, job_info.path)
 
                 if self.tracker:
                     self.tracker.complete_encode()
@@ -561,6 +693,7 @@ class QueueManager:
 
         if count > 0:
             log.info("Recovered interrupted jobs", count=count)
+            self._ready_event.set()
             if self.tracker:
                 self.tracker.add_event(f"Recovered {count} interrupted job(s)")
 
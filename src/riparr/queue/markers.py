@@ -10,6 +10,8 @@ This allows recovery of interrupted jobs on restart.
 """
 
 import json
+import os
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -63,6 +65,13 @@ class MarkerManager:
             base_dir: Base directory for raw MKV files and markers
         """
         self.base_dir = Path(base_dir)
+        # Cache of list_jobs results keyed by status filter, valid for a
+        # single marker_signature value; repeated queries while nothing
+        # changed on disk skip the rglob + JSON parse. The cache is
+        # dropped whenever the signature moves, so it never outgrows the
+        # handful of filter variants.
+        self._list_cache: dict[str | None, list[JobInfo]] = {}
+        self._cache_signature: tuple[int, ...] | None = None
 
     def create_marker(
         self,
@@ -82,8 +91,49 @@ class MarkerManager:
         Returns:
             Path to the created marker file
         """
-        # Remove any existing markers
-        self.remove_markers(mkv_path)
+        marker_path = self._write_marker(
+            mkv_path, status, datetime.now().isoformat(), metadata, error
+        )
+        self._list_cache.clear()
+        return marker_path
+
+    def create_markers(
+        self,
+        mkv_paths: Iterable[Path],
+        status: JobStatus,
+        metadata: dict[str, str | int | None] | None = None,
+    ) -> list[Path]:
+        """Create markers for a batch of MKV files in one pass.
+
+        Equivalent to create_marker per file, but the timestamp is taken
+        and the list cache invalidated once for the whole batch.
+
+        Args:
+            mkv_paths: Paths to the MKV files
+            status: Job status for every file
+            metadata: Optional metadata shared by the batch
+
+        Returns:
+            Paths to the created marker files
+        """
+        created_at = datetime.now().isoformat()
+        markers = [
+            self._write_marker(mkv_path, status, created_at, metadata, None)
+            for mkv_path in mkv_paths
+        ]
+        self._list_cache.clear()
+        return markers
+
+    def _write_marker(
+        self,
+        mkv_path: Path,
+        status: JobStatus,
+        created_at: str,
+        metadata: dict[str, str | int | None] | None,
+        error: str | None,
+    ) -> Path:
+        """Replace any existing markers for an MKV with a new one."""
+        self._remove_marker_files(mkv_path)
 
         marker_path = mkv_path.with_suffix(
             mkv_path.suffix + self.MARKER_SUFFIXES[status]
@@ -91,7 +141,7 @@ class MarkerManager:
 
         marker_data: dict[str, str | dict[str, str | int | None]] = {
             "status": status,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at,
             "mkv_path": str(mkv_path),
         }
 
@@ -102,9 +152,32 @@ class MarkerManager:
 
         marker_path.write_text(json.dumps(marker_data, indent=2))
         log.debug("Created marker", path=str(marker_path), status=status)
-
         return marker_path
 
+    def marker_signature(self) -> tuple[int, ...]:
+        """Cheap change signal: mtimes of the marker dir and its subdirs.
+
+        Markers live next to their MKVs in per-disc subdirectories, and
+        on POSIX a directory's mtime only moves when a *direct* child
+        changes — so the base directory's mtime alone misses marker
+        writes inside those subdirs (e.g. a manual queue retry from
+        another process). A handful of stat calls covers both levels
+        without rescanning and re-parsing every marker.
+
+        Returns:
+            Tuple of mtimes (base dir first, then each direct subdir)
+        """
+        sig: list[int] = []
+        try:
+            sig.append(os.stat(self.base_dir).st_mtime_ns)
+            with os.scandir(self.base_dir) as entries:
+                sig.extend(
+                    entry.stat().st_mtime_ns for entry in entries if entry.is_dir()
+                )
+        except OSError:
+            pass
+        return tuple(sig)
+
     def get_status(self, mkv_path: Path) -> JobStatus | None:
         """Get the status of an MKV file.
 
@@ -158,12 +231,26 @@ class MarkerManager:
     def list_jobs(self, status_filter: str | None = None) -> list[JobInfo]:
         """List all jobs in the queue.
 
+        Results are cached against marker_signature(), so repeated calls
+        while the marker tree is unchanged don't re-stat every marker
+        file — and a marker written by another process invalidates the
+        cache on the next call.
+
         Args:
             status_filter: Filter by status (ready, transcoding, failed, complete)
 
         Returns:
             List of JobInfo objects
         """
+        signature = self.marker_signature()
+        if signature != self._cache_signature:
+            self._list_cache.clear()
+            self._cache_signature = signature
+
+        cached = self._list_cache.get(status_filter)
+        if cached is not None:
+            return cached
+
         jobs = []
 
         # Find all MKV files with markers
@@ -213,6 +300,7 @@ class MarkerManager:
         # Sort by creation time
         jobs.sort(key=lambda j: j.created_at)
 
+        self._list_cache[status_filter] = jobs
         return jobs
 
     def get_next_ready(self) -> JobInfo | None:
@@ -280,6 +368,11 @@ class MarkerManager:
         Args:
             mkv_path: Path to the MKV file
         """
+        self._remove_marker_files(mkv_path)
+        self._list_cache.clear()
+
+    def _remove_marker_files(self, mkv_path: Path) -> None:
+        """Unlink every marker file for an MKV without cache invalidation."""
         for suffix in self.MARKER_SUFFIXES.values():
             marker_path = mkv_path.with_suffix(mkv_path.suffix + suffix)
             if marker_path.exists():
@@ -6,7 +6,7 @@ import structlog
 
 from riparr.config.settings import Settings
 from riparr.core.disc import Title
-from riparr.core.title import group_by_duration, is_likely_play_all
+from riparr.core.title import TitleArrays, group_by_duration, play_all_mask
 
 log = structlog.get_logger()
 
@@ -169,11 +169,13 @@ class TitleSelector:
         Returns:
             Titles without play-all entries
         """
-        result = []
+        # Build the column view once; the mask answers every candidate
+        # without rebuilding an "others" list per title.
+        mask = play_all_mask(TitleArrays.from_titles(titles))
 
-        for title in titles:
-            others = [t for t in titles if t.index != title.index]
-            if not is_likely_play_all(title, others):
+        result = []
+        for title, is_play_all in zip(titles, mask, strict=True):
+            if not is_play_all:
                 result.append(title)
             else:
                 log.debug("Filtered play-all title", index=title.index, duration=title.duration)